@@ -0,0 +1,127 @@
+"""
+Description:
+    Cost of pricing both sides of every non hedge
+    leg of many four leg RFQs.
+
+    - per leg: OrderManager.create_leg_price per leg and side.
+    - batched: one BatchLegPricer.price pass per side.
+
+    Requires NumPy.
+
+Usage:
+    python3.9 -m benchmarks.batch_pricing
+"""
+
+# built ins
+import asyncio
+import gc
+import time
+from typing import Callable, List, Tuple
+
+# project
+from benchmarks.fakes import create_instrument, create_rfq
+from benchmarks.order_payload import create_order_manager
+from helpers.constants import OrderDirection
+from helpers.order_manager import MakerOrderManager
+from helpers.pricing import BatchLegPricer, NUMPY_AVAILABLE
+from helpers.resources import Instrument, RFQ
+
+RFQ_COUNTS: Tuple[int, ...] = (1000, 5000)
+REPEATS: int = 15
+
+
+def create_priced_rfqs(rfq_count: int) -> List[RFQ]:
+    """
+    Returns RFQs with four legs whose marks are set.
+    """
+    instrument: Instrument = create_instrument(instrument_id='0')
+    rfqs: List[RFQ] = []
+    for index in range(rfq_count):
+        rfq: RFQ = create_rfq(
+            rfq_id=f'r{index}',
+            instrument_ids=['0', '1', '2', '3']
+            )
+        for leg in rfq.legs.values():
+            leg.add_attributes(instrument=instrument)
+            leg.update_mark_price(mark_price='0.0125')
+        rfqs.append(rfq)
+    return rfqs
+
+
+async def price_per_leg(
+    order_manager: MakerOrderManager,
+    rfqs: List[RFQ]
+        ) -> None:
+    """
+    Prices every leg and side through create_leg_price.
+    """
+    for rfq in rfqs:
+        for order_direction in OrderDirection:
+            for leg in rfq.legs.values():
+                price_ticks: int = await order_manager.create_leg_price(
+                    leg=leg,
+                    order_direction=order_direction
+                    )
+                leg.update_order_price(
+                    order_direction=order_direction,
+                    order_price_ticks=price_ticks
+                    )
+
+
+def price_batched(
+    batch_leg_pricer: BatchLegPricer,
+    rfqs: List[RFQ]
+        ) -> None:
+    """
+    Prices every leg and side in one pass per side.
+    """
+    for order_direction in OrderDirection:
+        batch_leg_pricer.price(
+            rfqs=rfqs,
+            order_direction=order_direction
+            )
+
+
+def measure(func: Callable[[], None]) -> float:
+    """
+    Returns the best time [ms] of REPEATS runs without GC.
+    """
+    best: float = float('inf')
+    for _ in range(REPEATS):
+        gc.collect()
+        gc.disable()
+        start: float = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+        gc.enable()
+    return best * 1e3
+
+
+def main() -> None:
+    if not NUMPY_AVAILABLE:
+        print('NumPy is not installed')
+        return
+
+    order_manager: MakerOrderManager = create_order_manager()
+    batch_leg_pricer: BatchLegPricer = BatchLegPricer(
+        order_pricing_tick_multiple=order_manager.order_pricing_tick_multiple
+        )
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+
+    print('RFQs    per leg     batched')
+    for rfq_count in RFQ_COUNTS:
+        rfqs: List[RFQ] = create_priced_rfqs(rfq_count=rfq_count)
+        per_leg_ms: float = measure(
+            lambda: loop.run_until_complete(
+                price_per_leg(order_manager=order_manager, rfqs=rfqs)
+                )
+            )
+        batched_ms: float = measure(
+            lambda: price_batched(batch_leg_pricer=batch_leg_pricer, rfqs=rfqs)
+            )
+        print(f'{rfq_count:<7} {per_leg_ms:>6.1f} ms  {batched_ms:>6.1f} ms')
+    loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Description:
+    Per-message decode cost of a bbo WebSocket message.
+
+    - before: json.loads twice, once in initial_ingest_message
+    and once in the processor.
+    - after: one json.loads.
+    - after: one helpers.json_backend.loads (orjson if installed).
+
+Usage:
+    python3.9 -m benchmarks.decode
+"""
+
+# built ins
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+# project
+from helpers import json_backend
+
+ITERATIONS: int = 200000
+
+
+def create_bbo_message(leg_count: int = 4) -> str:
+    """
+    Returns a raw bbo notification with greeks per leg.
+    """
+    leg: Dict = {
+        'mark_price': '0.0123',
+        'best_bid_price': '0.012',
+        'best_ask_price': '0.0125',
+        'greeks': {'delta': '0.5', 'gamma': '0.001', 'vega': '12.3', 'theta': '-4.5'}
+        }
+    return json.dumps({
+        'jsonrpc': '2.0',
+        'method': 'subscription',
+        'params': {
+            'channel': 'bbo.1a2b3c',
+            'data': {
+                'rfq_id': '1a2b3c',
+                'mark_price': '0.0123',
+                'best_bid_price': '0.012',
+                'best_ask_price': '0.0125',
+                'legs': [{'instrument_id': str(i), **leg} for i in range(leg_count)]
+                }
+            }
+        })
+
+
+def measure(func: Callable[[], Any]) -> float:
+    """
+    Returns the best per call time [us] of 5 repeats.
+    """
+    return min(timeit.repeat(func, number=ITERATIONS, repeat=5)) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    message: str = create_bbo_message()
+
+    before: float = measure(lambda: (json.loads(message), json.loads(message)))
+    after_json: float = measure(lambda: json.loads(message))
+    after_backend: float = measure(lambda: json_backend.loads(message))
+
+    print(f'{len(message)} byte bbo message, {ITERATIONS} iterations')
+    print(f'  before (json.loads x2):  {before:.1f} us')
+    print(f'  after  (json.loads x1):  {after_json:.1f} us')
+    print(f'  after  (json_backend):   {after_backend:.1f} us ({json_backend._backend.__name__})')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+"""
+    In-process stand-ins for the Paradigm REST and
+    WebSocket clients, and raw message builders,
+    used by the benchmarks.
+"""
+
+# built ins
+import asyncio
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+# project
+from helpers.constants import VenueInterface
+from helpers.managers import ManagedInstruments, MakerManagedRFQs, \
+     ManagedMMP
+from helpers.order_manager import MakerOrderManager
+from helpers.processors import ParadigmWSMessageProcessor
+from helpers.queues import PrioritizedMessageQueue
+from helpers.resources import Instrument, RFQ
+
+
+def create_instrument_message(
+    instrument_id: str,
+    venue: str = 'DBT',
+    kind: str = 'OPTION',
+    base_currency: str = 'BTC',
+    expires_at: float = 4102444800000,
+    mark_price: str = '0.01'
+        ) -> Dict:
+    """
+    Returns a raw ACTIVE Instrument object.
+    """
+    return {
+        'id': instrument_id,
+        'name': f'INSTRUMENT-{instrument_id}',
+        'venue': venue,
+        'kind': kind,
+        'base_currency': base_currency,
+        'expires_at': expires_at,
+        'venue_instrument_name': f'VENUE-INSTRUMENT-{instrument_id}',
+        'min_tick_size': '0.0005',
+        'min_order_size_increment': '0.1',
+        'min_block_size': '25',
+        'state': 'ACTIVE',
+        'greeks': {'mark_price': mark_price}
+        }
+
+
+def create_instrument(
+    instrument_id: str,
+    **kwargs
+        ) -> Instrument:
+    """
+    Returns an ingested Instrument object.
+    """
+    instrument: Instrument = Instrument()
+    instrument.ingest_raw_message(
+        message=create_instrument_message(instrument_id=instrument_id, **kwargs)
+        )
+    return instrument
+
+
+def create_rfq_message(
+    rfq_id: str,
+    instrument_ids: List[str],
+    state: str = 'OPEN'
+        ) -> Dict:
+    """
+    Returns a raw RFQ object with alternating SELL/BUY legs.
+    """
+    return {
+        'id': rfq_id,
+        'state': state,
+        'quantity': '25',
+        'side_layering_limit': 1,
+        'legs': [
+            {
+                'instrument_id': instrument_id,
+                'side': 'BUY' if index % 2 else 'SELL',
+                'ratio': '1',
+                'price': None
+                } for index, instrument_id in enumerate(instrument_ids)
+            ]
+        }
+
+
+def create_rfq(
+    rfq_id: str,
+    instrument_ids: List[str]
+        ) -> RFQ:
+    """
+    Returns an ingested RFQ object.
+    """
+    rfq: RFQ = RFQ()
+    rfq.ingest_raw_message(
+        message=create_rfq_message(rfq_id=rfq_id, instrument_ids=instrument_ids),
+        venue_interface=VenueInterface.REST
+        )
+    return rfq
+
+
+def create_bbo_message(
+    rfq_id: str,
+    mark_prices: Dict[str, str]
+        ) -> Dict:
+    """
+    Returns a decoded bbo notification of the RFQ's leg marks.
+    """
+    return {
+        'jsonrpc': '2.0',
+        'method': 'subscription',
+        'params': {
+            'channel': f'bbo.{rfq_id}',
+            'data': {
+                'rfq_id': rfq_id,
+                'legs': [
+                    {
+                        'instrument_id': instrument_id,
+                        'mark_price': mark_price
+                        } for instrument_id, mark_price in mark_prices.items()
+                    ]
+                }
+            }
+        }
+
+
+def get_rfq_instrument_ids(rfq_index: int) -> List[str]:
+    """
+    Returns the two Instrument ids quoted by the RFQ
+    at the index, out of FakeRESTClient's Instruments.
+    """
+    return [str(rfq_index % 5), str(rfq_index % 5 + 1)]
+
+
+class FakeRESTClient:
+    """
+    Stand-in for ParadigmRESTClient.
+
+    - Serves instrument_count Instruments and rfq_count OPEN
+    RFQs, each RFQ quoting get_rfq_instrument_ids.
+    - Order operations succeed after latency seconds.
+    """
+    def __init__(
+        self,
+        instrument_count: int = 10,
+        rfq_count: int = 0,
+        latency: float = 0
+            ) -> None:
+        self.instrument_count: int = instrument_count
+        self.rfq_count: int = rfq_count
+        self.latency: float = latency
+
+        # Instance Variables
+        self.order_id: int = 0
+
+        # Counters
+        self.request_counts: Dict[str, int] = {}
+        self.in_flight_requests: int = 0
+        self.max_in_flight_requests: int = 0
+
+    async def _request(self, name: str) -> None:
+        self.request_counts[name] = self.request_counts.get(name, 0) + 1
+        self.in_flight_requests += 1
+        self.max_in_flight_requests = max(self.max_in_flight_requests, self.in_flight_requests)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight_requests -= 1
+
+    async def iter_instrument_pages(self, state=None) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        await self._request(name='instruments')
+        yield 200, [
+            create_instrument_message(instrument_id=str(index))
+            for index in range(self.instrument_count)
+            ]
+
+    async def get_instrument(self, instrument_id: str) -> List[Instrument]:
+        await self._request(name='instrument')
+        return [create_instrument(instrument_id=instrument_id)]
+
+    async def get_rfqs(self, state=None) -> List[RFQ]:
+        await self._request(name='rfqs')
+        return [
+            create_rfq(
+                rfq_id=f'r{index}',
+                instrument_ids=get_rfq_instrument_ids(rfq_index=index)
+                ) for index in range(self.rfq_count)
+            ]
+
+    async def iter_rfqs(self, state=None) -> AsyncIterator[Tuple[int, List[RFQ]]]:
+        yield 200, await self.get_rfqs(state=state)
+
+    async def get_orders(self, state=None) -> List[Dict]:
+        await self._request(name='orders')
+        return []
+
+    async def iter_orders(self, state=None) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        yield 200, await self.get_orders(state=state)
+
+    async def get_mmp(self) -> bool:
+        return False
+
+    async def patch_mmp(self) -> None:
+        await self._request(name='mmp')
+
+    async def post_orders(self, payload: Dict, **kwargs) -> Tuple[int, Dict]:
+        await self._request(name='post_orders')
+        self.order_id += 1
+        return 201, {'id': f'o{self.order_id}'}
+
+    async def put_orders_replace(self, payload: Dict, order_id: str, **kwargs) -> Tuple[int, Dict]:
+        await self._request(name='put_orders_replace')
+        return 200, {'id': order_id}
+
+
+class FakeWSClient:
+    """
+    Stand-in for ParadigmWebSocketClient which
+    discards subscription operations.
+    """
+    def __init__(self) -> None:
+        # Instance Variables
+        self.reconnect_callback: Optional[Callable] = None
+
+    def register_reconnect_callback(self, callback: Callable) -> None:
+        self.reconnect_callback = callback
+
+    async def create_send_ws_operation(self, channel: str, operation: str) -> None:
+        pass
+
+
+async def create_maker(
+    rest_client: FakeRESTClient,
+    order_refresh_window: float,
+    **kwargs
+        ) -> Tuple[PrioritizedMessageQueue, MakerOrderManager]:
+    """
+    Wires the market maker's managers to the fake clients,
+    as market-maker.py does, and waits for the startup syncs.
+
+    Returns the WebSocket message queue the processor
+    consumes and the MakerOrderManager.
+    """
+    message_queue: PrioritizedMessageQueue = PrioritizedMessageQueue()
+    managed_instruments: ManagedInstruments = ManagedInstruments(
+        rest_client=rest_client
+        )
+    managed_rfqs: MakerManagedRFQs = MakerManagedRFQs(
+        rest_client=rest_client,
+        ws_client=FakeWSClient(),
+        managed_instruments=managed_instruments
+        )
+    managed_mmp: ManagedMMP = ManagedMMP(
+        rest_client=rest_client
+        )
+    ParadigmWSMessageProcessor(
+        message_queue=message_queue,
+        managed_rfqs=managed_rfqs,
+        managed_mmp=managed_mmp
+        )
+    order_manager: MakerOrderManager = MakerOrderManager(
+        account_name='benchmark',
+        rest_client=rest_client,
+        order_price_worse_than_mark_flag=True,
+        order_pricing_tick_multiple=10,
+        order_refresh_window_lower_boundary=order_refresh_window,
+        order_refresh_window_upper_boundary=order_refresh_window,
+        managed_rfqs=managed_rfqs,
+        managed_mmp=managed_mmp,
+        **kwargs
+        )
+    await asyncio.sleep(0.05 + rest_client.latency * 4)
+    return message_queue, order_manager
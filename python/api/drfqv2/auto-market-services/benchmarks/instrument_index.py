@@ -0,0 +1,102 @@
+"""
+Description:
+    Cost of picking a random Instrument matching a venue, kind
+    and base_currency out of INSTRUMENT_COUNT Instruments, where
+    only one Instrument matches.
+
+    - before: rejection sampling over list(instruments).
+    - after: ManagedInstruments.choose_random_instrument.
+
+Usage:
+    python3.9 -m benchmarks.instrument_index
+"""
+
+# built ins
+import asyncio
+import time
+from random import choice
+from typing import List
+
+# project
+from benchmarks.fakes import FakeRESTClient, create_instrument
+from helpers.managers import ManagedInstruments
+from helpers.resources import Instrument
+
+INSTRUMENT_COUNT: int = 20000
+REJECTION_PICKS: int = 3
+INDEXED_PICKS: int = 10000
+
+
+def choose_random_instrument(
+    managed_instruments: ManagedInstruments,
+    venue: str,
+    kind: str,
+    base_currency: str
+        ) -> Instrument:
+    """
+    Reference copy of the previous RFQCreator rejection sampling.
+    """
+    while True:
+        instrument_id: str = choice(list(managed_instruments.instruments))
+        instrument: Instrument = managed_instruments.instruments[instrument_id]
+
+        if instrument.venue != venue:
+            continue
+
+        if instrument.base_currency != base_currency:
+            continue
+
+        if instrument.kind != kind:
+            continue
+
+        return instrument
+
+
+async def main() -> None:
+    managed_instruments: ManagedInstruments = ManagedInstruments(
+        rest_client=FakeRESTClient(instrument_count=0)
+        )
+    instruments: List[Instrument] = [
+        create_instrument(
+            instrument_id=str(index),
+            kind='OPTION' if index % 100 else 'FUTURE',
+            base_currency='BTC' if index % 2 else 'ETH',
+            expires_at=4102444800000 + index % 50
+            ) for index in range(INSTRUMENT_COUNT)
+        ]
+    instruments.append(
+        create_instrument(
+            instrument_id='rare',
+            venue='BYB',
+            base_currency='SOL'
+            )
+        )
+    await managed_instruments.update_hashmap(
+        instruments=instruments
+        )
+    print(f'{len(managed_instruments.instruments)} Instruments, one BYB/OPTION/SOL')
+
+    start: float = time.perf_counter()
+    for _ in range(REJECTION_PICKS):
+        choose_random_instrument(
+            managed_instruments=managed_instruments,
+            venue='BYB',
+            kind='OPTION',
+            base_currency='SOL'
+            )
+    elapsed: float = (time.perf_counter() - start) / REJECTION_PICKS
+    print(f'  before (rejection sampling): {elapsed:.2f} s per pick')
+
+    start = time.perf_counter()
+    for _ in range(INDEXED_PICKS):
+        managed_instruments.choose_random_instrument(
+            venue='BYB',
+            kind='OPTION',
+            base_currency='SOL'
+            )
+    elapsed = (time.perf_counter() - start) / INDEXED_PICKS
+    print(f'  after  (attribute index):    {elapsed * 1e6:.1f} us per pick')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+Description:
+    Number of [GET] /instruments/{id} requests made when
+    RFQ_COUNT OPEN RFQs, all quoting Instruments not yet
+    known, are ingested concurrently at startup.
+
+    - before: every RFQ requests each of its unknown legs.
+    - after: ManagedInstruments shares in-flight requests.
+
+Usage:
+    python3.9 -m benchmarks.instrument_requests
+"""
+
+# built ins
+import asyncio
+from typing import List
+
+# project
+from benchmarks.fakes import FakeRESTClient, FakeWSClient, create_rfq, \
+     get_rfq_instrument_ids
+from helpers.managers import ManagedInstruments, MakerManagedRFQs
+from helpers.resources import RFQ
+
+RFQ_COUNT: int = 50
+REQUEST_LATENCY: float = 0.05
+
+
+async def add_instrument_attributes_to_legs(
+    managed_instruments: ManagedInstruments,
+    rfq: RFQ
+        ) -> None:
+    """
+    Reference copy of the previous per leg requests.
+    """
+    for instrument_id, leg in rfq.legs.items():
+        if instrument_id not in managed_instruments.instruments:
+            await managed_instruments.request_instrument(
+                instrument_id=instrument_id
+                )
+        leg.add_attributes(
+            instrument=managed_instruments.instruments[instrument_id]
+            )
+
+
+async def create_managers() -> MakerManagedRFQs:
+    """
+    Returns MakerManagedRFQs whose ManagedInstruments
+    knows no Instruments.
+    """
+    rest_client: FakeRESTClient = FakeRESTClient(
+        instrument_count=0,
+        latency=REQUEST_LATENCY
+        )
+    managed_instruments: ManagedInstruments = ManagedInstruments(
+        rest_client=rest_client
+        )
+    managed_rfqs: MakerManagedRFQs = MakerManagedRFQs(
+        rest_client=rest_client,
+        ws_client=FakeWSClient(),
+        managed_instruments=managed_instruments
+        )
+    # Let the startup syncs complete
+    await asyncio.sleep(REQUEST_LATENCY * 3)
+    rest_client.request_counts.clear()
+    return managed_rfqs
+
+
+async def main() -> None:
+    rfqs: List[RFQ] = [
+        create_rfq(
+            rfq_id=f'r{index}',
+            instrument_ids=get_rfq_instrument_ids(rfq_index=index)
+            ) for index in range(RFQ_COUNT)
+        ]
+    instrument_count: int = len({
+        instrument_id for rfq in rfqs for instrument_id in rfq.legs
+        })
+    print(f'{RFQ_COUNT} OPEN RFQs over {instrument_count} unknown Instruments')
+
+    managed_rfqs: MakerManagedRFQs = await create_managers()
+    await asyncio.gather(
+        *[
+            add_instrument_attributes_to_legs(
+                managed_instruments=managed_rfqs.managed_instruments,
+                rfq=rfq
+                ) for rfq in rfqs
+            ]
+        )
+    print(f'  before (per leg):      {managed_rfqs.rest_client.request_counts["instrument"]} requests')
+
+    managed_rfqs = await create_managers()
+    await asyncio.gather(
+        *[managed_rfqs.add_instrument_attributes_to_legs(rfq=rfq) for rfq in rfqs]
+        )
+    print(f'  after  (single-flight): {managed_rfqs.rest_client.request_counts["instrument"]} requests')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""
+Description:
+    Concurrency of Order operations with RFQ_COUNT open RFQs
+    quoted in the same refresh window.
+
+    Reports the peak number of in flight REST requests and of
+    asyncio tasks, which were previously two new tasks per RFQ
+    per window, along with the work queue counters.
+
+Usage:
+    python3.9 -m benchmarks.order_operation_pool
+"""
+
+# built ins
+import asyncio
+from typing import Dict
+
+# project
+from benchmarks.fakes import FakeRESTClient, create_bbo_message, create_maker, \
+     get_rfq_instrument_ids
+from helpers.order_manager import MakerOrderManager
+from helpers.queues import PrioritizedMessageQueue
+
+RFQ_COUNT: int = 2000
+REQUEST_LATENCY: float = 0.002
+REFRESH_WINDOW: float = 0.3
+DURATION: float = 2.0
+
+
+async def main() -> None:
+    rest_client: FakeRESTClient = FakeRESTClient(
+        rfq_count=RFQ_COUNT,
+        latency=REQUEST_LATENCY
+        )
+    message_queue: PrioritizedMessageQueue
+    order_manager: MakerOrderManager
+    message_queue, order_manager = await create_maker(
+        rest_client=rest_client,
+        order_refresh_window=REFRESH_WINDOW
+        )
+    rest_client.max_in_flight_requests = 0
+
+    for index in range(RFQ_COUNT):
+        message_queue.put_nowait(
+            create_bbo_message(
+                rfq_id=f'r{index}',
+                mark_prices={
+                    instrument_id: '1.0'
+                    for instrument_id in get_rfq_instrument_ids(rfq_index=index)
+                    }
+                )
+            )
+
+    max_task_count: int = 0
+    for _ in range(int(DURATION / 0.01)):
+        await asyncio.sleep(0.01)
+        max_task_count = max(max_task_count, len(asyncio.all_tasks()))
+
+    stats: Dict[str, int] = order_manager.order_operation_stats()
+    print(f'{RFQ_COUNT} RFQs, {REQUEST_LATENCY * 1e3:.0f} ms REST latency, {DURATION:.0f} s')
+    print(f'  peak in flight requests: {rest_client.max_in_flight_requests}')
+    print(f'  peak asyncio tasks:      {max_task_count}')
+    print(f'  creates sent:            {stats["sent_create"]}')
+    print(f'  queue max depth:         {stats["queue_max_depth"]}')
+    print(f'  queue superseded:        {stats["queue_superseded"]}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
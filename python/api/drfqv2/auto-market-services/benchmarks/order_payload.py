@@ -0,0 +1,98 @@
+"""
+Description:
+    Cost of MakerOrderManager.create_order_payload
+    for a four leg RFQ.
+
+    Only depends on helpers, so it can be run against earlier
+    revisions of the tree for comparison.
+
+Usage:
+    python3.9 -m benchmarks.order_payload
+"""
+
+# built ins
+import asyncio
+import timeit
+from typing import Dict
+
+# project
+from benchmarks.fakes import create_instrument, create_rfq
+from helpers.constants import OrderDirection
+from helpers.order_manager import MakerOrderManager
+from helpers.resources import Instrument, RFQ
+
+ITERATIONS: int = 20000
+MARK_PRICE: str = '0.0125'
+
+
+def create_order_manager() -> MakerOrderManager:
+    """
+    Returns a MakerOrderManager with only the
+    attributes used to build payloads.
+    """
+    order_manager: MakerOrderManager = MakerOrderManager.__new__(MakerOrderManager)
+    order_manager.account_name = 'benchmark'
+    order_manager.order_pricing_tick_multiple = 10
+    return order_manager
+
+
+def create_priced_rfq(leg_count: int = 4) -> RFQ:
+    """
+    Returns an RFQ whose legs have a mark price.
+    """
+    instrument: Instrument = create_instrument(instrument_id='0')
+    rfq: RFQ = create_rfq(
+        rfq_id='r0',
+        instrument_ids=[str(index) for index in range(leg_count)]
+        )
+    for leg in rfq.legs.values():
+        leg.add_attributes(instrument=instrument)
+        if hasattr(leg, 'update_mark_price'):
+            leg.update_mark_price(mark_price=MARK_PRICE)
+        else:
+            leg.mark_price = MARK_PRICE
+    return rfq
+
+
+async def create_order_payloads(
+    order_manager: MakerOrderManager,
+    rfq: RFQ
+        ) -> None:
+    """
+    Creates ITERATIONS BUY Order payloads for the RFQ.
+    """
+    for _ in range(ITERATIONS):
+        await order_manager.create_order_payload(
+            rfq=rfq,
+            order_direction=OrderDirection.BUY
+            )
+
+
+def main() -> None:
+    order_manager: MakerOrderManager = create_order_manager()
+    rfq: RFQ = create_priced_rfq()
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+
+    elapsed: float = min(
+        timeit.repeat(
+            lambda: loop.run_until_complete(
+                create_order_payloads(order_manager=order_manager, rfq=rfq)
+                ),
+            number=1,
+            repeat=5
+            )
+        )
+    payload: Dict = loop.run_until_complete(
+        order_manager.create_order_payload(
+            rfq=rfq,
+            order_direction=OrderDirection.BUY
+            )
+        )
+    loop.close()
+
+    print(f'4 leg create_order_payload: {elapsed / ITERATIONS * 1e6:.1f} us per call')
+    print(f'  leg prices: {[leg["price"] for leg in payload["legs"]]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Description:
+    Time to paginate [GET] /instruments from a local
+    aiohttp server with a fixed per page latency.
+
+    - before: serial pages with asyncio.sleep(1) between them.
+    - after: ParadigmRESTClient.paginate_endpoint, which prefetches
+    the next page and is paced by the rate limiter.
+
+Usage:
+    python3.9 -m benchmarks.pagination
+"""
+
+# built ins
+import asyncio
+import base64
+import time
+from typing import Dict, List
+
+# installed
+from aiohttp import web
+
+# project
+from interface_clients.rest import ParadigmRESTClient
+from helpers.constants import RateLimitClass
+
+PAGE_COUNT: int = 10
+PAGE_SIZE: int = 100
+PAGE_LATENCY: float = 0.02
+PORT: int = 8765
+
+
+async def instruments_handler(request: web.Request) -> web.Response:
+    """
+    Serves PAGE_COUNT pages of PAGE_SIZE results after PAGE_LATENCY.
+    """
+    await asyncio.sleep(PAGE_LATENCY)
+    page: int = int(request.query.get('cursor', 0))
+    return web.json_response({
+        'next': str(page + 1) if page + 1 < PAGE_COUNT else None,
+        'results': [{'id': f'{page}-{i}'} for i in range(PAGE_SIZE)]
+        })
+
+
+async def paginate_serially(
+    rest_client: ParadigmRESTClient,
+    method: str,
+    endpoint: str
+        ) -> List[Dict]:
+    """
+    Reference copy of the previous paginate_endpoint.
+    """
+    headers: Dict = rest_client.create_headers(
+        method=method,
+        endpoint=endpoint
+        )
+    status_code, response = await rest_client._get_request(
+        endpoint=endpoint,
+        headers=headers
+        )
+    result: List[Dict] = [x for x in response['results']]
+    cursor: str = response['next']
+
+    while cursor is not None:
+        await asyncio.sleep(1)
+        cursor_endpoint: str = f'{endpoint}&cursor={cursor}'
+        headers = rest_client.create_headers(
+            method=method,
+            endpoint=cursor_endpoint
+            )
+        status_code, response = await rest_client._get_request(
+            endpoint=cursor_endpoint,
+            headers=headers
+            )
+        result.extend(response['results'])
+        cursor = response['next']
+    return result
+
+
+async def main() -> None:
+    app: web.Application = web.Application()
+    app.router.add_get('/v2/drfq/instruments', instruments_handler)
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', PORT).start()
+
+    endpoint: str = f'/v2/drfq/instruments?page_size={PAGE_SIZE}'
+    rest_client: ParadigmRESTClient = ParadigmRESTClient(
+        connection_url=f'http://127.0.0.1:{PORT}',
+        access_key='benchmark',
+        secret_key=base64.b64encode(b'benchmark').decode('utf-8')
+        )
+
+    print(f'{PAGE_COUNT} pages of {PAGE_SIZE} results, {PAGE_LATENCY * 1e3:.0f} ms per page')
+    async with rest_client:
+        start: float = time.perf_counter()
+        results: List[Dict] = await paginate_serially(
+            rest_client=rest_client,
+            method='GET',
+            endpoint=endpoint
+            )
+        print(f'  before (serial, 1 s sleep):  {time.perf_counter() - start:.2f} s, {len(results)} results')
+
+        start = time.perf_counter()
+        results = await rest_client.paginate_endpoint(
+            method='GET',
+            endpoint=endpoint,
+            rate_limit_class=RateLimitClass.INSTRUMENTS
+            )
+        print(f'  after  (prefetch, limiter):  {time.perf_counter() - start:.2f} s, {len(results)} results')
+
+    await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""
+Description:
+    Order replaces sent and suppressed per
+    ORDER_REPLACE_TICK_THRESHOLD.
+
+    RFQ_COUNT RFQs are requoted every 50 ms refresh window for
+    one second, while each RFQ's leg marks move by -2..2 ticks
+    per bbo update. The mark walk is seeded, so runs compare.
+
+Usage:
+    python3.9 -m benchmarks.replace_suppression
+"""
+
+# built ins
+import asyncio
+import random
+from typing import Dict, Tuple
+
+# project
+from benchmarks.fakes import FakeRESTClient, create_bbo_message, create_maker, \
+     get_rfq_instrument_ids
+from helpers.order_manager import MakerOrderManager
+from helpers.queues import PrioritizedMessageQueue
+
+RFQ_COUNT: int = 20
+REFRESH_WINDOW: float = 0.05
+BBO_UPDATES: int = 20
+MIN_TICK_SIZE: float = 0.0005
+THRESHOLDS: Tuple[int, ...] = (0, 1, 2)
+
+
+async def run(order_replace_tick_threshold: int) -> Dict[str, int]:
+    """
+    Returns the Order operation counters after the simulation.
+    """
+    random.seed(1)
+    message_queue: PrioritizedMessageQueue
+    order_manager: MakerOrderManager
+    message_queue, order_manager = await create_maker(
+        rest_client=FakeRESTClient(rfq_count=RFQ_COUNT, latency=0.005),
+        order_refresh_window=REFRESH_WINDOW,
+        order_replace_tick_threshold=order_replace_tick_threshold
+        )
+
+    mark_ticks: Dict[int, int] = {index: 2000 for index in range(RFQ_COUNT)}
+    for _ in range(BBO_UPDATES):
+        for index in range(RFQ_COUNT):
+            mark_ticks[index] += random.choice([-2, -1, 0, 0, 0, 0, 1, 2])
+            mark_price: str = f'{mark_ticks[index] * MIN_TICK_SIZE:.4f}'
+            message_queue.put_nowait(
+                create_bbo_message(
+                    rfq_id=f'r{index}',
+                    mark_prices={
+                        instrument_id: mark_price
+                        for instrument_id in get_rfq_instrument_ids(rfq_index=index)
+                        }
+                    )
+                )
+        await asyncio.sleep(REFRESH_WINDOW)
+    return order_manager.order_operation_stats()
+
+
+def main() -> None:
+    print(f'{RFQ_COUNT} RFQs, {REFRESH_WINDOW * 1e3:.0f} ms refresh windows, marks moving -2..2 ticks per bbo')
+    for order_replace_tick_threshold in THRESHOLDS:
+        stats: Dict[str, int] = asyncio.run(
+            run(order_replace_tick_threshold=order_replace_tick_threshold)
+            )
+        print(
+            f'  threshold {order_replace_tick_threshold}: '
+            f'{stats["sent_replace"]} replaces sent, {stats["suppressed_replace"]} suppressed'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Description:
+    Memory and access cost of the resource model.
+
+    - Memory per tracked RFQ (two legs, Instrument
+    attributes added) and per Instrument.
+    - Five RFQLeg attribute reads, as done per leg when pricing.
+    - RFQ construction from a raw message.
+
+    Only depends on helpers.resources, so it can be run against
+    earlier revisions of the tree for comparison.
+
+Usage:
+    python3.9 -m benchmarks.resource_memory
+"""
+
+# built ins
+import timeit
+import tracemalloc
+from typing import Dict, List
+
+# project
+from benchmarks.fakes import create_instrument, create_rfq, create_rfq_message
+from helpers.constants import VenueInterface
+from helpers.resources import Instrument, RFQ, RFQLeg
+
+RESOURCE_COUNT: int = 10000
+
+
+def main() -> None:
+    instrument: Instrument = create_instrument(instrument_id='0')
+
+    tracemalloc.start()
+    rfqs: List[RFQ] = []
+    for index in range(RESOURCE_COUNT):
+        rfq: RFQ = create_rfq(
+            rfq_id=f'r{index}',
+            instrument_ids=['0', '1']
+            )
+        for leg in rfq.legs.values():
+            leg.add_attributes(instrument=instrument)
+        rfqs.append(rfq)
+    rfq_bytes: int = tracemalloc.get_traced_memory()[0]
+
+    instruments: List[Instrument] = [
+        create_instrument(instrument_id=str(index)) for index in range(RESOURCE_COUNT)
+        ]
+    instrument_bytes: int = tracemalloc.get_traced_memory()[0] - rfq_bytes
+    tracemalloc.stop()
+
+    leg: RFQLeg = rfqs[0].legs['0']
+    read_ns: float = min(
+        timeit.repeat(
+            lambda: (leg.side, leg.hedge_leg_flag, leg.min_tick_size, leg.price_precision, leg.min_block_size),
+            number=1000000,
+            repeat=5
+            )
+        ) * 1e3
+
+    message: Dict = create_rfq_message(rfq_id='r0', instrument_ids=['0', '1'])
+    build_us: float = min(
+        timeit.repeat(
+            lambda: RFQ().ingest_raw_message(message=message, venue_interface=VenueInterface.REST),
+            number=100000,
+            repeat=5
+            )
+        ) * 10
+
+    print(f'{RESOURCE_COUNT} RFQs with two legs and {len(instruments)} Instruments')
+    print(f'  memory per RFQ:        {rfq_bytes / RESOURCE_COUNT:.0f} bytes')
+    print(f'  memory per Instrument: {instrument_bytes / RESOURCE_COUNT:.0f} bytes')
+    print(f'  five leg reads:        {read_ns:.0f} ns')
+    print(f'  RFQ construction:      {build_us:.2f} us')
+
+
+if __name__ == '__main__':
+    main()
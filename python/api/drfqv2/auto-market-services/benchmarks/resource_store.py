@@ -0,0 +1,59 @@
+"""
+Description:
+    RFQ membership overhead per Order operation with 1k
+    and 10k open RFQs, for the RFQ in the middle of the store.
+
+    - before: three `in list(dict)` checks plus lookups, as in
+    the previous manage_order_operation_request.
+    - after: one ResourceStore.get plus two `in` checks.
+
+Usage:
+    python3.9 -m benchmarks.resource_store
+"""
+
+# built ins
+import timeit
+from typing import Dict, Tuple
+
+# project
+from helpers.containers import ResourceStore
+
+RFQ_COUNTS: Tuple[int, ...] = (1000, 10000)
+ITERATIONS: int = 2000
+
+
+def main() -> None:
+    print('open RFQs   in list(dict)   ResourceStore')
+    for rfq_count in RFQ_COUNTS:
+        rfqs: Dict[str, object] = {f'r{index}': object() for index in range(rfq_count)}
+        store: ResourceStore = ResourceStore()
+        for rfq_id, rfq in rfqs.items():
+            store[rfq_id] = rfq
+        rfq_id: str = f'r{rfq_count // 2}'
+
+        def before() -> None:
+            if rfq_id not in list(rfqs):
+                return
+            rfqs[rfq_id]
+            if rfq_id not in list(rfqs):
+                return
+            rfqs[rfq_id]
+            if rfq_id not in list(rfqs):
+                return
+            rfqs[rfq_id]
+
+        def after() -> None:
+            if store.get(rfq_id) is None:
+                return
+            if rfq_id not in store:
+                return
+            if rfq_id not in store:
+                return
+
+        before_us: float = min(timeit.repeat(before, number=ITERATIONS, repeat=5)) / ITERATIONS * 1e6
+        after_us: float = min(timeit.repeat(after, number=ITERATIONS * 50, repeat=5)) / (ITERATIONS * 50) * 1e6
+        print(f'{rfq_count:<11} {before_us:>8.1f} us     {after_us:>8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
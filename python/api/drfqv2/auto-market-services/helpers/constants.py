@@ -25,3 +25,52 @@ class VenueInterface(Enum):
 class OrderState(Enum):
     OPEN = auto()
     CLOSED = auto()
+
+
+class OrderStatus(Enum):
+    # Local lifecycle of the user's Order on an RFQ side
+    IDLE = auto()
+    CREATING = auto()
+    LIVE = auto()
+    REPLACING = auto()
+    DEAD = auto()
+
+
+class RateLimitClass(Enum):
+    ORDERS = auto()
+    RFQS = auto()
+    INSTRUMENTS = auto()
+
+
+class RequestPriority(Enum):
+    HIGH = auto()
+    NORMAL = auto()
+    LOW = auto()
+
+
+class OrderOperationTrigger(Enum):
+    REFRESH_WINDOW = auto()
+    NEW_RFQ = auto()
+    MARK_PRICE = auto()
+    ORDER_ACK = auto()
+    RFQ_CLOSED = auto()
+
+
+class OrderRequoteMode(Enum):
+    REFRESH_WINDOW = auto()
+    MARK_MOVE = auto()
+
+
+class LifecycleState(Enum):
+    CONNECTED = auto()
+    AUTHENTICATED = auto()
+    INSTRUMENTS_LOADED = auto()
+    RFQS_SYNCED = auto()
+
+
+class MessageLane(Enum):
+    # Ordered from highest to lowest processing priority
+    MMP = auto()
+    ORDERS = auto()
+    RFQS = auto()
+    MARKET_DATA = auto()
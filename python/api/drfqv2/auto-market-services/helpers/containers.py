@@ -0,0 +1,119 @@
+# built ins
+from random import randrange
+from typing import Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T', bound=Hashable)
+R = TypeVar('R')
+
+
+class RandomAccessSet(Generic[T]):
+    """
+    Set supporting O(1) add, discard, membership
+    and uniformly random choice.
+    """
+    def __init__(self) -> None:
+        # Instance Variables
+        self.items: List[T] = []
+        self.positions: Dict[T, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self.positions
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def add(self, item: T) -> None:
+        """
+        Adds the item if not already present.
+        """
+        if item in self.positions:
+            return
+        self.positions[item] = len(self.items)
+        self.items.append(item)
+
+    def discard(self, item: T) -> None:
+        """
+        Removes the item if present by moving the
+        last item into its position.
+        """
+        position: int = self.positions.pop(item, -1)
+        if position == -1:
+            return
+        last_item: T = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last_item
+            self.positions[last_item] = position
+
+    def choice(self) -> T:
+        """
+        Returns a uniformly random item.
+        Raises IndexError if empty.
+        """
+        return self.items[randrange(len(self.items))]
+
+
+class ResourceStore(Generic[R]):
+    """
+    Id keyed store of Paradigm resources.
+    - O(1) membership, lookup and removal.
+    - Iteration and the items/values/ids APIs work on a
+    snapshot, so the store may be mutated while iterating
+    across awaits.
+    """
+    def __init__(self) -> None:
+        # Instance Variables
+        self.resources: Dict[str, R] = {}
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def __contains__(self, resource_id: str) -> bool:
+        return resource_id in self.resources
+
+    def __getitem__(self, resource_id: str) -> R:
+        return self.resources[resource_id]
+
+    def __setitem__(self, resource_id: str, resource: R) -> None:
+        self.resources[resource_id] = resource
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids())
+
+    def get(
+        self,
+        resource_id: str
+            ) -> Optional[R]:
+        """
+        Returns the resource, None if unknown.
+        """
+        return self.resources.get(resource_id)
+
+    def pop(
+        self,
+        resource_id: str
+            ) -> Optional[R]:
+        """
+        Removes and returns the resource, None if unknown.
+        """
+        return self.resources.pop(resource_id, None)
+
+    def ids(self) -> List[str]:
+        """
+        Returns a snapshot of the resource ids.
+        """
+        return list(self.resources)
+
+    def values(self) -> List[R]:
+        """
+        Returns a snapshot of the resources.
+        """
+        return list(self.resources.values())
+
+    def items(self) -> List[Tuple[str, R]]:
+        """
+        Returns a snapshot of the (id, resource) pairs.
+        """
+        return list(self.resources.items())
@@ -0,0 +1,66 @@
+# built ins
+from typing import Awaitable, Callable, Dict, Optional
+
+
+ChannelHandler = Callable[[Dict], Awaitable[None]]
+
+
+class ChannelDispatcher:
+    """
+    Routes WebSocket messages to the handler registered
+    for their channel prefix, e.g. 'bbo' for 'bbo.{rfq_id}'.
+
+    The handler of each channel is resolved once and cached
+    so per-message dispatch is a single dict lookup.
+    """
+    def __init__(
+        self,
+        max_cached_channels: int = 10000
+            ) -> None:
+        self.max_cached_channels: int = max_cached_channels
+
+        # Instance Variables
+        self.handlers: Dict[str, ChannelHandler] = {}
+        self.resolved_handlers: Dict[str, Optional[ChannelHandler]] = {}
+
+    def register(
+        self,
+        channel_prefix: str,
+        handler: ChannelHandler
+            ) -> None:
+        """
+        Registers the handler for all channels with the prefix.
+        """
+        self.handlers[channel_prefix] = handler
+        self.resolved_handlers.clear()
+
+    def resolve(
+        self,
+        channel: str
+            ) -> Optional[ChannelHandler]:
+        """
+        Returns the handler of the channel, resolving and
+        caching it on first use.
+        """
+        handler: Optional[ChannelHandler] = self.resolved_handlers.get(channel)
+        if handler is None and channel not in self.resolved_handlers:
+            # Bound the cache as per-RFQ channels come and go
+            if len(self.resolved_handlers) >= self.max_cached_channels:
+                self.resolved_handlers.clear()
+
+            handler = self.handlers.get(channel.split('.', 1)[0])
+            self.resolved_handlers[channel] = handler
+        return handler
+
+    async def dispatch(
+        self,
+        message: Dict
+            ) -> None:
+        """
+        Calls the handler of the message's channel.
+        """
+        handler: Optional[ChannelHandler] = self.resolve(
+            channel=message['params']['channel']
+            )
+        if handler is not None:
+            await handler(message)
@@ -0,0 +1,23 @@
+"""
+    JSON decoding backend for the WebSocket receive path.
+
+    Uses orjson when it is installed and falls back to
+    the standard library json module otherwise.
+"""
+
+# built ins
+from typing import Any, Union
+
+try:
+    # installed
+    import orjson as _backend
+except ImportError:
+    # built ins
+    import json as _backend
+
+
+def loads(message: Union[str, bytes]) -> Any:
+    """
+    Decodes a JSON document.
+    """
+    return _backend.loads(message)
@@ -0,0 +1,54 @@
+# built ins
+import asyncio
+from typing import Dict
+
+# project
+from helpers.constants import LifecycleState
+
+
+class ServiceLifecycle:
+    """
+    Awaitable readiness states shared by the
+    service components.
+    """
+    def __init__(self) -> None:
+        # Instance Variables
+        self.events: Dict[LifecycleState, asyncio.Event] = {
+            state: asyncio.Event() for state in LifecycleState
+            }
+
+    def set(
+        self,
+        state: LifecycleState
+            ) -> None:
+        """
+        Flags the state as reached and releases its waiters.
+        """
+        self.events[state].set()
+
+    def clear(
+        self,
+        state: LifecycleState
+            ) -> None:
+        """
+        Flags the state as no longer reached.
+        """
+        self.events[state].clear()
+
+    def is_set(
+        self,
+        state: LifecycleState
+            ) -> bool:
+        """
+        Returns True if the state has been reached.
+        """
+        return self.events[state].is_set()
+
+    async def wait_for(
+        self,
+        state: LifecycleState
+            ) -> None:
+        """
+        Waits until the state has been reached.
+        """
+        await self.events[state].wait()
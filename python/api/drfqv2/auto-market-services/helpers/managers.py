@@ -1,12 +1,19 @@
 # built ins
 import asyncio
 from abc import abstractmethod, ABC
-from typing import Dict, List
+import heapq
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import logging
+import time
 
 # project
-from helpers.constants import InstrumentState, RFQState, VenueInterface
+from helpers.containers import RandomAccessSet, ResourceStore
+from helpers.dispatchers import ChannelDispatcher
+from helpers.constants import InstrumentState, RFQState, VenueInterface, \
+     OrderOperationTrigger, LifecycleState, OrderState
+from helpers.lifecycle import ServiceLifecycle
 from helpers.resources import RFQ, Instrument
+from helpers.snapshots import InstrumentSnapshot
 from interface_clients.websockets import ParadigmWebSocketClient
 from interface_clients.rest import ParadigmRESTClient
 
@@ -17,12 +24,26 @@ class ManagedInstruments:
     """
     def __init__(
         self,
-        rest_client: ParadigmRESTClient
+        rest_client: ParadigmRESTClient,
+        lifecycle: Optional[ServiceLifecycle] = None,
+        snapshot: Optional[InstrumentSnapshot] = None
             ) -> None:
         self.rest_client: ParadigmRESTClient = rest_client
+        self.lifecycle: ServiceLifecycle = lifecycle or ServiceLifecycle()
+        self.snapshot: Optional[InstrumentSnapshot] = snapshot
 
         # Instance Variables
-        self.instruments: Dict[str, Instrument] = {}
+        self.instruments: ResourceStore[Instrument] = ResourceStore()
+        self.expiry_heap: List[Tuple[float, str]] = []
+        self.expiry_timer: Optional[asyncio.TimerHandle] = None
+        self.expiry_timer_at: Optional[float] = None
+        self.in_flight_instrument_requests: Dict[str, asyncio.Task] = {}
+
+        # Secondary Indexes
+        # venue -> kind -> base_currency -> Instrument ids
+        self.attribute_index: Dict[str, Dict[str, Dict[str, RandomAccessSet]]] = {}
+        # expires_at -> Instrument ids
+        self.expiry_index: Dict[float, Set[str]] = {}
 
         # Request all ACTIVE Paradigm Instruments
         asyncio.get_event_loop().create_task(
@@ -43,23 +64,297 @@ class ManagedInstruments:
         the Instruments specified.
         """
         for instrument in instruments:
+            replaced_instrument: Optional[Instrument] = self.instruments.get(instrument.id)
+            if replaced_instrument is not None:
+                self.unindex_instrument(instrument=replaced_instrument)
+
             self.instruments[instrument.id] = instrument
+            self.index_instrument(instrument=instrument)
+            self.schedule_instrument_expiry(
+                instrument=instrument
+                )
 
-    async def get_active_instruments(self) -> None:
+    def remove_instrument(
+        self,
+        instrument_id: str
+            ) -> None:
         """
-        - Requests all ACTIVE Paradigm Instruments.
-        - Updates Instrument hashmap.
+        Removes an Instrument from the Instrument hashmap.
         """
-        instruments: List[Instrument] = await self.rest_client.get_instruments(
+        instrument: Optional[Instrument] = self.instruments.pop(instrument_id)
+        if instrument is not None:
+            self.unindex_instrument(instrument=instrument)
+
+    def index_instrument(
+        self,
+        instrument: Instrument
+            ) -> None:
+        """
+        Adds the Instrument to the secondary indexes.
+        """
+        self.attribute_index.setdefault(
+            instrument.venue, {}
+            ).setdefault(
+                instrument.kind, {}
+                ).setdefault(
+                    instrument.base_currency, RandomAccessSet()
+                    ).add(instrument.id)
+        self.expiry_index.setdefault(instrument.expires_at, set()).add(instrument.id)
+
+    def unindex_instrument(
+        self,
+        instrument: Instrument
+            ) -> None:
+        """
+        Removes the Instrument from the secondary indexes,
+        pruning emptied branches.
+        """
+        kinds: Dict[str, Dict[str, RandomAccessSet]] = self.attribute_index.get(instrument.venue, {})
+        base_currencies: Dict[str, RandomAccessSet] = kinds.get(instrument.kind, {})
+        instrument_ids: Optional[RandomAccessSet] = base_currencies.get(instrument.base_currency)
+        if instrument_ids is not None:
+            instrument_ids.discard(instrument.id)
+            if not instrument_ids:
+                del base_currencies[instrument.base_currency]
+                if not base_currencies:
+                    del kinds[instrument.kind]
+                    if not kinds:
+                        del self.attribute_index[instrument.venue]
+
+        expiring_ids: Optional[Set[str]] = self.expiry_index.get(instrument.expires_at)
+        if expiring_ids is not None:
+            expiring_ids.discard(instrument.id)
+            if not expiring_ids:
+                del self.expiry_index[instrument.expires_at]
+
+    def get_instrument_ids(
+        self,
+        venue: str,
+        kind: str,
+        base_currency: str
+            ) -> RandomAccessSet:
+        """
+        Returns the ids of the Instruments matching the
+        venue, kind and base_currency specified.
+        """
+        return self.attribute_index.get(venue, {}).get(kind, {}).get(
+            base_currency, RandomAccessSet()
+            )
+
+    def get_instrument_ids_by_expiry(
+        self,
+        expires_at: float
+            ) -> Set[str]:
+        """
+        Returns the ids of the Instruments expiring at
+        the expires_at [ms] specified.
+        """
+        return self.expiry_index.get(expires_at, set())
+
+    def choose_random_instrument(
+        self,
+        venue: str,
+        kind: str,
+        base_currency: str
+            ) -> Optional[Instrument]:
+        """
+        Returns a random Instrument matching the venue, kind
+        and base_currency specified, None if there is none.
+        """
+        instrument_ids: RandomAccessSet = self.get_instrument_ids(
+            venue=venue,
+            kind=kind,
+            base_currency=base_currency
+            )
+        if not instrument_ids:
+            return None
+        return self.instruments[instrument_ids.choice()]
+
+    def schedule_instrument_expiry(
+        self,
+        instrument: Instrument
+            ) -> None:
+        """
+        - Tracks the Instrument's expires_at [ms] in the expiry heap.
+        - Moves the eviction timer forward if it is now the earliest.
+        """
+        if not instrument.expires_at:
+            return
+
+        heapq.heappush(
+            self.expiry_heap,
+            (instrument.expires_at, instrument.id)
+            )
+
+        if self.expiry_timer_at is not None and \
+                self.expiry_timer_at <= instrument.expires_at:
+            return
+
+        if self.expiry_timer is not None:
+            self.expiry_timer.cancel()
+
+        self.expiry_timer_at = instrument.expires_at
+        self.expiry_timer = asyncio.get_event_loop().call_later(
+            max(instrument.expires_at / 1000 - time.time(), 0),
+            self.evict_expired_instruments
+            )
+
+    def evict_expired_instruments(self) -> None:
+        """
+        - Removes every Instrument whose expires_at has passed.
+        - Re-arms the eviction timer on the next expiry.
+        """
+        self.expiry_timer = None
+        self.expiry_timer_at = None
+
+        now: float = time.time() * 1000
+        evicted: int = 0
+        while self.expiry_heap and self.expiry_heap[0][0] <= now:
+            expires_at, instrument_id = heapq.heappop(self.expiry_heap)
+            instrument: Optional[Instrument] = self.instruments.get(instrument_id)
+            # Skip stale entries of removed or re-listed Instruments
+            if instrument is None or instrument.expires_at != expires_at:
+                continue
+            self.remove_instrument(instrument_id=instrument_id)
+            evicted += 1
+
+        if evicted:
+            logging.info(f'Evicted {evicted} expired Instruments')
+
+        if self.expiry_heap:
+            expires_at: float = self.expiry_heap[0][0]
+            self.expiry_timer_at = expires_at
+            self.expiry_timer = asyncio.get_event_loop().call_later(
+                max(expires_at / 1000 - time.time(), 0),
+                self.evict_expired_instruments
+                )
+
+    async def sync_instruments(self) -> bool:
+        """
+        Incrementally syncs the Instrument hashmap with
+        all ACTIVE Paradigm Instruments.
+        - Known Instruments only have their mutable fields updated.
+        - Instrument objects are only created for new listings.
+        - Instruments no longer ACTIVE are removed, provided every
+        page was received.
+
+        Returns True if every page was received.
+        """
+        seen_instrument_ids: Set[str] = set()
+        new_instruments: List[Instrument] = []
+        added: int = 0
+        updated: int = 0
+        complete: bool = True
+
+        async for status_code, results in self.rest_client.iter_instrument_pages(
             state=InstrumentState.ACTIVE
+                ):
+            if status_code != 200:
+                complete = False
+                break
+
+            for message in results:
+                instrument_id: str = message['id']
+                seen_instrument_ids.add(instrument_id)
+
+                instrument: Optional[Instrument] = self.instruments.get(instrument_id)
+                if instrument is None:
+                    instrument = Instrument()
+                    instrument.ingest_raw_message(
+                        message=message
+                        )
+                    new_instruments.append(instrument)
+                elif instrument.ingest_update(message=message):
+                    updated += 1
+
+            await self.update_hashmap(
+                instruments=new_instruments
+                )
+            added += len(new_instruments)
+            new_instruments = []
+
+        if not complete:
+            logging.info('Instrument sync incomplete, skipping removals')
+            return False
+
+        removed_instrument_ids: List[str] = [
+            instrument_id for instrument_id in self.instruments.ids()
+            if instrument_id not in seen_instrument_ids
+            ]
+        for instrument_id in removed_instrument_ids:
+            self.remove_instrument(instrument_id=instrument_id)
+
+        logging.info(
+            f'Instrument sync | Total: {len(self.instruments)} | Added: {added} | '
+            f'Updated: {updated} | Removed: {len(removed_instrument_ids)}'
             )
+        return True
+
+    async def load_snapshot(self) -> None:
+        """
+        Populates the Instrument hashmap from the
+        on-disk Instrument snapshot, if configured.
+        """
+        if self.snapshot is None:
+            return
+
+        messages: List[Dict] = await asyncio.get_event_loop().run_in_executor(
+            None,
+            self.snapshot.load
+            )
+
+        instruments: List[Instrument] = []
+        for message in messages:
+            instrument: Instrument = Instrument()
+            instrument.ingest_raw_message(
+                message=message
+                )
+            instruments.append(instrument)
 
-        # Update Hashmap
         await self.update_hashmap(
             instruments=instruments
             )
+        logging.info(f'Loaded {len(instruments)} Instruments from snapshot')
 
-    async def add_new_instrument(
+    async def save_snapshot(self) -> None:
+        """
+        Persists the Instrument hashmap to the
+        on-disk Instrument snapshot, if configured.
+        """
+        if self.snapshot is None:
+            return
+
+        messages: List[Dict] = [
+            instrument.to_raw_message() for instrument in self.instruments.values()
+            ]
+        await asyncio.get_event_loop().run_in_executor(
+            None,
+            self.snapshot.save,
+            messages
+            )
+
+    async def get_active_instruments(self) -> None:
+        """
+        - Warm starts from the Instrument snapshot, if any.
+        - Requests all ACTIVE Paradigm Instruments, retrying
+        with backoff until a sync succeeds with Instruments.
+        - Updates Instrument hashmap.
+        """
+        await self.load_snapshot()
+        if self.instruments:
+            # Reconcile with Paradigm in the background of the warm start
+            self.lifecycle.set(LifecycleState.INSTRUMENTS_LOADED)
+
+        retry_delay: float = 1
+        while not await self.sync_instruments() or not self.instruments:
+            logging.info(f'Initial Instrument sync failed | Retrying in {retry_delay}s')
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+
+        await self.save_snapshot()
+        self.lifecycle.set(LifecycleState.INSTRUMENTS_LOADED)
+
+    async def request_instrument(
         self,
         instrument_id: str
             ) -> None:
@@ -76,15 +371,58 @@ class ManagedInstruments:
             instruments=instruments
             )
 
+    async def add_new_instrument(
+        self,
+        instrument_id: str
+            ) -> None:
+        """
+        Requests a specific Instrument from Paradigm, sharing
+        a single in-flight request between concurrent callers.
+        """
+        task: Optional[asyncio.Task] = self.in_flight_instrument_requests.get(instrument_id)
+        if task is None:
+            task = asyncio.get_event_loop().create_task(
+                self.request_instrument(
+                    instrument_id=instrument_id
+                    )
+                )
+            self.in_flight_instrument_requests[instrument_id] = task
+            task.add_done_callback(
+                lambda _: self.in_flight_instrument_requests.pop(instrument_id, None)
+                )
+
+        # Shielded so a cancelled caller does not cancel the shared request
+        await asyncio.shield(task)
+
+    async def add_new_instruments(
+        self,
+        instrument_ids: List[str]
+            ) -> None:
+        """
+        Concurrently requests every unknown Instrument specified.
+        """
+        missing_instrument_ids: Set[str] = {
+            instrument_id for instrument_id in instrument_ids
+            if instrument_id not in self.instruments
+            }
+        await asyncio.gather(
+            *[
+                self.add_new_instrument(
+                    instrument_id=instrument_id
+                    ) for instrument_id in missing_instrument_ids
+                ]
+            )
+
     async def periodic_instrument_hashmap_update(self) -> None:
         """
-        Periodic task to update existing Instrument hashmap.
+        Periodic task to incrementally sync the
+        existing Instrument hashmap.
         """
         while True:
             await asyncio.sleep(600)
 
-            # Request all ACTIVE Instruments
-            await self.get_active_instruments()
+            if await self.sync_instruments():
+                await self.save_snapshot()
 
 
 class ManagedRFQs(ABC):
@@ -95,20 +433,49 @@ class ManagedRFQs(ABC):
         self,
         rest_client: ParadigmRESTClient,
         ws_client: ParadigmWebSocketClient,
-        managed_instruments: ManagedInstruments
+        managed_instruments: ManagedInstruments,
+        lifecycle: Optional[ServiceLifecycle] = None
             ) -> None:
         self.rest_client: ParadigmRESTClient = rest_client
         self.ws_client: ParadigmWebSocketClient = ws_client
         self.managed_instruments: ManagedInstruments = managed_instruments
+        self.lifecycle: ServiceLifecycle = lifecycle or ServiceLifecycle()
 
         # Instance Variables
-        self.rfqs: Dict[str, RFQ] = {}
+        self.rfqs: ResourceStore[RFQ] = ResourceStore()
+        self.order_operation_listeners: List[Callable[[OrderOperationTrigger, str], None]] = []
 
         # Request all OPEN RFQs
         asyncio.get_event_loop().create_task(
             self.get_open_rfqs()
             )
 
+        # Resync RFQs and Orders upon WebSocket reconnection
+        self.ws_client.register_reconnect_callback(
+            self.resync_rfqs
+            )
+
+    def register_order_operation_listener(
+        self,
+        listener: Callable[[OrderOperationTrigger, str], None]
+            ) -> None:
+        """
+        Registers a callback notified of RFQ events
+        which may require an Order operation.
+        """
+        self.order_operation_listeners.append(listener)
+
+    def notify_order_operation_listeners(
+        self,
+        trigger: OrderOperationTrigger,
+        rfq_id: str
+            ) -> None:
+        """
+        Notifies the registered listeners of an RFQ event.
+        """
+        for listener in self.order_operation_listeners:
+            listener(trigger, rfq_id)
+
     async def _add_rfq_to_hashmap(
         self,
         rfqs: List[RFQ]
@@ -129,11 +496,12 @@ class ManagedRFQs(ABC):
         - min_order_size_incremenet
         - min_block_size
         """
+        # Request unknown Instruments at once
+        await self.managed_instruments.add_new_instruments(
+            instrument_ids=list(rfq.legs)
+            )
+
         for instrument_id, leg in rfq.legs.items():
-            if instrument_id not in list(self.managed_instruments.instruments):
-                await self.managed_instruments.add_new_instrument(
-                    instrument_id=instrument_id
-                    )
             # Add Instrument Attributes to RFQ Leg
             rfq.legs[instrument_id].add_attributes(
                 instrument=self.managed_instruments.instruments[instrument_id]
@@ -184,6 +552,11 @@ class ManagedRFQs(ABC):
             rfq_id=rfq.id
             )
 
+        self.notify_order_operation_listeners(
+            trigger=OrderOperationTrigger.NEW_RFQ,
+            rfq_id=rfq.id
+            )
+
         logging.info(f'Ingested RFQ ID: {rfq.id}')
 
     async def remove_closed_rfq(
@@ -194,7 +567,12 @@ class ManagedRFQs(ABC):
         Removes CLOSED RFQ from hashmap.
         """
         # Remove from RFQ hashmap
-        self.rfqs.pop(rfq.id, None)
+        self.rfqs.pop(rfq.id)
+
+        self.notify_order_operation_listeners(
+            trigger=OrderOperationTrigger.RFQ_CLOSED,
+            rfq_id=rfq.id
+            )
 
         # Subscribe to venue_bbo.* WS Channel
         await self.action_on_closed_rfq(
@@ -215,22 +593,125 @@ class ManagedRFQs(ABC):
         else:
             await self.remove_closed_rfq(rfq=rfq)
 
+    async def sync_open_rfqs(self) -> bool:
+        """
+        Ingests all OPEN RFQs page by page, skipping
+        RFQs already in the RFQ hashmap.
+
+        Returns True if every page was received.
+        """
+        async for status_code, rfqs in self.rest_client.iter_rfqs(
+            state=RFQState.OPEN
+                ):
+            if status_code != 200:
+                return False
+
+            await asyncio.gather(
+                *[self.ingest_rfq_update(rfq=rfq) for rfq in rfqs if rfq.id not in self.rfqs]
+                )
+        return True
+
     async def get_open_rfqs(self) -> None:
         """
-        - Requests all OPEN RFQs.
+        - Requests all OPEN RFQs, retrying with backoff
+        until every page is received.
         - Updates RFQ hashmap.
         """
-        rfqs: List[RFQ] = await self.rest_client.get_rfqs(
+        retry_delay: float = 1
+        while not await self.sync_open_rfqs():
+            logging.info(f'Initial RFQ sync failed | Retrying in {retry_delay}s')
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+
+        self.lifecycle.set(LifecycleState.RFQS_SYNCED)
+
+    async def fetch_open_rfqs(self) -> Optional[List[RFQ]]:
+        """
+        Requests all OPEN RFQs.
+
+        Returns None unless every page was received.
+        """
+        rfqs: List[RFQ] = []
+        async for status_code, page in self.rest_client.iter_rfqs(
             state=RFQState.OPEN
+                ):
+            if status_code != 200:
+                return None
+            rfqs.extend(page)
+        return rfqs
+
+    async def fetch_open_orders(self) -> Optional[List[Dict]]:
+        """
+        Requests all of the user's OPEN Orders.
+
+        Returns None unless every page was received.
+        """
+        orders: List[Dict] = []
+        async for status_code, page in self.rest_client.iter_orders(
+            state=OrderState.OPEN
+                ):
+            if status_code != 200:
+                return None
+            orders.extend(page)
+        return orders
+
+    async def resync_rfqs(self) -> None:
+        """
+        Resyncs the RFQ hashmap and the user's Orders after
+        a WebSocket reconnection.
+        - Retries with backoff until all OPEN RFQs and Orders
+        are received, keeping the RFQ hashmap meanwhile.
+        - Removes RFQs CLOSED while disconnected.
+        - Ingests RFQs OPENED while disconnected.
+        - Resets Order ids as Orders are cancelled on disconnect,
+        then re-applies any OPEN Orders.
+        """
+        self.lifecycle.clear(LifecycleState.RFQS_SYNCED)
+
+        # Reset before any await so Orders made LIVE meanwhile are
+        # kept, in flight Orders settle from their REST response
+        for rfq in self.rfqs.values():
+            rfq.reset_order_ids()
+
+        retry_delay: float = 1
+        while True:
+            rfqs: Optional[List[RFQ]] = await self.fetch_open_rfqs()
+            orders: Optional[List[Dict]] = None
+            if rfqs is not None:
+                orders = await self.fetch_open_orders()
+            if orders is not None:
+                break
+
+            logging.info(f'RFQ resync failed | Retrying in {retry_delay}s')
+            await asyncio.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, 30)
+
+        open_rfqs: Dict[str, RFQ] = {rfq.id: rfq for rfq in rfqs}
+
+        # Remove RFQs CLOSED while disconnected
+        for rfq_id, rfq in self.rfqs.items():
+            if rfq_id not in open_rfqs:
+                await self.remove_closed_rfq(
+                    rfq=rfq
+                    )
+
+        # Ingest RFQs OPENED while disconnected
+        await asyncio.gather(
+            *[self.ingest_rfq_update(rfq=rfq) for rfq_id, rfq in open_rfqs.items() if rfq_id not in self.rfqs]
             )
 
-        # Ingest OPEN RFQs
-        for rfq in rfqs:
-            asyncio.get_event_loop().create_task(
-                self.ingest_rfq_update(
-                    rfq=rfq
+        # Re-apply OPEN Orders
+        for order in orders:
+            rfq: Optional[RFQ] = self.rfqs.get(order['rfq_id'])
+            if rfq is not None:
+                rfq.ingest_order_update(
+                    message=order,
+                    venue_interface=VenueInterface.REST
                     )
-                )
+
+        self.lifecycle.set(LifecycleState.RFQS_SYNCED)
+
+        logging.info(f'Resynced RFQs | No OPEN RFQs: {len(self.rfqs)} | No OPEN Orders: {len(orders)}')
 
     async def ingest_market_data_update(
         self,
@@ -244,45 +725,99 @@ class ManagedRFQs(ABC):
         hashmap: Dict[str, str] = {}
         for leg in message['params']['data']['legs']:
             hashmap[leg['instrument_id']] = leg['mark_price']
-        if rfq_id in self.rfqs:
+        rfq: Optional[RFQ] = self.rfqs.get(rfq_id)
+        if rfq is not None:
             for instrument_id, mark_price in hashmap.items():
-                self.rfqs[rfq_id].legs[instrument_id].mark_price = mark_price
+                rfq.legs[instrument_id].update_mark_price(
+                    mark_price=mark_price
+                    )
 
-    async def ingest_ws_message(
+            self.notify_order_operation_listeners(
+                trigger=OrderOperationTrigger.MARK_PRICE,
+                rfq_id=rfq_id
+                )
+
+    async def ingest_rfq_message(
         self,
         message: Dict
             ) -> None:
         """
-        Ingests updates relating to RFQs, Orders, and VenueBBO.
+        Ingests a message from the rfqs WS channel.
         """
-        ws_channel: str = message['params']['channel'].split('.')
-        ws_channel_base: str = ws_channel[0]
+        data: Dict = message['params']['data']
+        if data['state'] != RFQState.OPEN.name:
+            # No need to build the RFQ just to remove it
+            known_rfq: Optional[RFQ] = self.rfqs.get(data['id'])
+            if known_rfq is not None:
+                await self.remove_closed_rfq(rfq=known_rfq)
+            return
 
-        if ws_channel_base == 'rfqs':
-            rfq: RFQ = RFQ()
-            rfq.ingest_raw_message(
-                message=message,
-                venue_interface=VenueInterface.WS
-                )
-            await self.ingest_rfq_update(rfq=rfq)
-        elif ws_channel_base == 'bbo':
-            await self.ingest_market_data_update(
-                message=message
-                )
-        elif ws_channel_base == 'orders':
-            rfq_id: str = message['params']['data']['rfq_id']
-            if rfq_id not in list(self.rfqs):
-                return
-            self.rfqs[rfq_id].ingest_order_update(
-                message=message
-                )
-        elif ws_channel_base == 'rfq_orders':
-            rfq_id: str = message['params']['data']['rfq_id']
-            if rfq_id not in list(self.rfqs):
-                return
-            self.rfqs[rfq_id].ingest_rfq_order_update(
-                message=message
-                )
+        rfq: RFQ = RFQ()
+        rfq.ingest_raw_message(
+            message=message,
+            venue_interface=VenueInterface.WS
+            )
+        await self.ingest_rfq_update(rfq=rfq)
+
+    async def ingest_order_message(
+        self,
+        message: Dict
+            ) -> None:
+        """
+        Ingests a message from the orders WS channel.
+        """
+        rfq_id: str = message['params']['data']['rfq_id']
+        rfq: Optional[RFQ] = self.rfqs.get(rfq_id)
+        if rfq is None:
+            return
+        rfq.ingest_order_update(
+            message=message,
+            venue_interface=VenueInterface.WS
+            )
+        self.notify_order_operation_listeners(
+            trigger=OrderOperationTrigger.ORDER_ACK,
+            rfq_id=rfq_id
+            )
+
+    async def ingest_rfq_order_message(
+        self,
+        message: Dict
+            ) -> None:
+        """
+        Ingests a message from the rfq_orders WS channel.
+        """
+        rfq_id: str = message['params']['data']['rfq_id']
+        rfq: Optional[RFQ] = self.rfqs.get(rfq_id)
+        if rfq is None:
+            return
+        rfq.ingest_rfq_order_update(
+            message=message
+            )
+
+    def register_channel_handlers(
+        self,
+        dispatcher: ChannelDispatcher
+            ) -> None:
+        """
+        Registers the handlers of the RFQs, Orders,
+        RFQ Orders and VenueBBO WS channels.
+        """
+        dispatcher.register(
+            channel_prefix='rfqs',
+            handler=self.ingest_rfq_message
+            )
+        dispatcher.register(
+            channel_prefix='bbo',
+            handler=self.ingest_market_data_update
+            )
+        dispatcher.register(
+            channel_prefix='orders',
+            handler=self.ingest_order_message
+            )
+        dispatcher.register(
+            channel_prefix='rfq_orders',
+            handler=self.ingest_rfq_order_message
+            )
 
 
 class MakerManagedRFQs(ManagedRFQs):
@@ -293,12 +828,14 @@ class MakerManagedRFQs(ManagedRFQs):
         self,
         rest_client: ParadigmRESTClient,
         ws_client: ParadigmWebSocketClient,
-        managed_instruments: ManagedInstruments
+        managed_instruments: ManagedInstruments,
+        lifecycle: Optional[ServiceLifecycle] = None
             ) -> None:
         super().__init__(
             rest_client,
             ws_client,
-            managed_instruments
+            managed_instruments,
+            lifecycle
             )
 
     async def action_on_open_rfq(
@@ -338,12 +875,14 @@ class TakerManagedRFQs(ManagedRFQs):
         self,
         rest_client: ParadigmRESTClient,
         ws_client: ParadigmWebSocketClient,
-        managed_instruments: ManagedInstruments
+        managed_instruments: ManagedInstruments,
+        lifecycle: Optional[ServiceLifecycle] = None
             ) -> None:
         super().__init__(
             rest_client,
             ws_client,
-            managed_instruments
+            managed_instruments,
+            lifecycle
             )
 
     async def action_on_open_rfq(
@@ -391,6 +930,18 @@ class ManagedMMP:
         if self.is_triggered:
             await self.rest_client.patch_mmp()
 
+    def register_channel_handlers(
+        self,
+        dispatcher: ChannelDispatcher
+            ) -> None:
+        """
+        Registers the handler of the market_maker_protection WS channel.
+        """
+        dispatcher.register(
+            channel_prefix='market_maker_protection',
+            handler=self.ingest_ws_message
+            )
+
     async def ingest_ws_message(
         self,
         message: Dict
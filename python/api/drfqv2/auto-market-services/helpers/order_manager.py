@@ -1,15 +1,18 @@
 # built ins
 import asyncio
 from random import uniform, choice, randint
-from typing import Dict, List
+from typing import Dict, List, Iterable, Optional, Set
 from abc import ABC, abstractmethod
 import logging
 
 # project
 from interface_clients.rest import ParadigmRESTClient
 from helpers.managers import ManagedRFQs, ManagedMMP
-from helpers.constants import RFQState, OrderDirection
+from helpers.constants import RFQState, OrderDirection, OrderOperationTrigger, \
+     OrderRequoteMode
 from helpers.resources import RFQ, Order, RFQLeg, RFQOrder
+from helpers.pricing import BatchLegPricer, NUMPY_AVAILABLE
+from helpers.queues import DeduplicatingWorkQueue
 
 
 class OrderManager(ABC):
@@ -27,7 +30,14 @@ class OrderManager(ABC):
         self.managed_rfqs: ManagedRFQs = managed_rfqs
 
         # Instance Variables
-        self.able_to_order_operate: bool = False
+        self.order_operation_event: asyncio.Event = asyncio.Event()
+        self.pending_rfq_ids: Set[str] = set()
+        self.deferred_rfq_ids: Set[str] = set()
+
+        # Listen to RFQ events which may require an Order operation
+        self.managed_rfqs.register_order_operation_listener(
+            self.ingest_order_operation_trigger
+            )
 
         # Instantiate Periodic Order Operation Flag
         asyncio.get_event_loop().create_task(
@@ -42,9 +52,20 @@ class OrderManager(ABC):
     @abstractmethod
     async def periodic_window_flag(self) -> None:
         """
-        Randomly creates and modifies able_to_order_operate
-        flag as so the Order Operation coroutine knows
-        when it is able to act.
+        Periodically emits the REFRESH_WINDOW trigger to
+        ingest_order_operation_trigger, which requests
+        Order operations for the RFQs to requote.
+        """
+        pass
+
+    @abstractmethod
+    def ingest_order_operation_trigger(
+        self,
+        trigger: OrderOperationTrigger,
+        rfq_id: str
+            ) -> None:
+        """
+        Decides if an RFQ event requires an Order operation.
         """
         pass
 
@@ -56,6 +77,26 @@ class OrderManager(ABC):
         """
         pass
 
+    def request_order_operation(
+        self,
+        rfq_ids: Iterable[str]
+            ) -> None:
+        """
+        Marks the RFQs as pending an Order operation and
+        wakes the Order Manager.
+        """
+        self.pending_rfq_ids.update(rfq_ids)
+        if self.pending_rfq_ids:
+            self.order_operation_event.set()
+
+    def pop_pending_rfq_ids(self) -> Set[str]:
+        """
+        Returns and clears the RFQs pending an Order operation.
+        """
+        rfq_ids: Set[str] = self.pending_rfq_ids
+        self.pending_rfq_ids = set()
+        return rfq_ids
+
     @abstractmethod
     async def manage_order_operation_request(
         self,
@@ -119,7 +160,7 @@ class OrderManager(ABC):
             if not flag:
                 continue
 
-            flag = False if not leg.mark_price else True
+            flag = False if leg.mark_price_ticks is None else True
 
         return flag
 
@@ -142,59 +183,53 @@ class OrderManager(ABC):
         Determines if the system needs to send a CREATE or REPLACE
         order operation.
         """
-        return True if not rfq.orders[order_direction].order_id else False
+        return rfq.orders[order_direction].is_create_required()
 
     async def create_leg_price(
         self,
         leg: RFQLeg,
         order_direction: OrderDirection = OrderDirection.BUY
-            ) -> float:
+            ) -> int:
         """
-        Creates a leg price depending upon the
-        order_pricing_tick_multiple env variable.
+        Creates a non hedge leg price [ticks] depending upon
+        the order_pricing_tick_multiple env variable.
         """
-        if leg.hedge_leg_flag:
-            return leg.price
-        else:
-            random_multiple: int = randint(
-                self.order_pricing_tick_multiple / 2,
-                self.order_pricing_tick_multiple
-                )
-            if leg.side == OrderDirection.BUY:
-                price: float = float(leg.mark_price) - (random_multiple * float(leg.min_tick_size))
+        random_multiple: int = randint(
+            self.order_pricing_tick_multiple // 2,
+            self.order_pricing_tick_multiple
+            )
+        if leg.side == OrderDirection.BUY:
+            price: int = leg.mark_price_ticks - random_multiple
 
-                if leg.sell_order_price:
-                    if price <= leg.sell_order_price:
-                        price = leg.sell_order_price - (random_multiple * float(leg.min_tick_size))
-            else:
-                price: float = float(leg.mark_price) + (random_multiple * float(leg.min_tick_size))
+            if leg.sell_order_price_ticks is not None:
+                if price <= leg.sell_order_price_ticks:
+                    price = leg.sell_order_price_ticks - random_multiple
+        else:
+            price: int = leg.mark_price_ticks + random_multiple
 
-                if leg.buy_order_price:
-                    if price >= leg.buy_order_price:
-                        price = leg.buy_order_price + (random_multiple * float(leg.min_tick_size))
+            if leg.buy_order_price_ticks is not None:
+                if price >= leg.buy_order_price_ticks:
+                    price = leg.buy_order_price_ticks + random_multiple
 
+        if price <= 0:
+            price = leg.mark_price_ticks
             if price <= 0:
-                price = float(leg.mark_price)
-                if price <= 0:
-                    price = float(leg.min_tick_size)
-            return round(price, leg.price_precision)
+                price = 1
+        return price
 
     async def order_manager(self) -> None:
         """
         Long running coroutine that:
+        - Waits until an Order operation is requested.
         - Creates Order Payloads
         - Submits Order Operations to Paradigm.
         """
         while True:
-            # Checks if time window permits or there are ManagedRFQs
-            if not self.able_to_order_operate or not self.managed_rfqs.rfqs:
-                await asyncio.sleep(0)
-                continue
+            await self.order_operation_event.wait()
+            self.order_operation_event.clear()
 
             await self.order_operation_request()
 
-            await asyncio.sleep(0.01)
-
 
 class MakerOrderManager(OrderManager):
     """
@@ -209,7 +244,12 @@ class MakerOrderManager(OrderManager):
         order_refresh_window_lower_boundary: float,
         order_refresh_window_upper_boundary: float,
         managed_rfqs: ManagedRFQs,
-        managed_mmp: ManagedMMP
+        managed_mmp: ManagedMMP,
+        order_replace_tick_threshold: int = 0,
+        order_requote_mode: OrderRequoteMode = OrderRequoteMode.REFRESH_WINDOW,
+        order_requote_mark_move_ticks: int = 1,
+        order_requote_min_interval: float = 0,
+        order_operation_concurrency: int = 16
             ) -> None:
         super().__init__(
             account_name,
@@ -221,23 +261,180 @@ class MakerOrderManager(OrderManager):
         self.order_refresh_window_lower_boundary: int = order_refresh_window_lower_boundary
         self.order_refresh_window_upper_boundary: int = order_refresh_window_upper_boundary
         self.managed_mmp: ManagedMMP = managed_mmp
+        self.order_replace_tick_threshold: int = order_replace_tick_threshold
+        self.order_requote_mode: OrderRequoteMode = order_requote_mode
+        self.order_requote_mark_move_ticks: int = order_requote_mark_move_ticks
+        self.order_requote_min_interval: float = order_requote_min_interval
+
+        # Mark Move Requoting
+        self.requote_mark_ticks: Dict[str, Dict[str, int]] = {}
+        self.requoted_at: Dict[str, float] = {}
+        self.requote_timers: Dict[str, asyncio.TimerHandle] = {}
+
+        # Counters
+        self.sent_create_count: int = 0
+        self.sent_replace_count: int = 0
+        self.suppressed_replace_count: int = 0
+
+        # Batched leg pricing, if NumPy is installed
+        self.batch_leg_pricer: Optional[BatchLegPricer] = BatchLegPricer(
+            order_pricing_tick_multiple=self.order_pricing_tick_multiple
+            ) if NUMPY_AVAILABLE else None
+        self.batch_pricing_min_rfqs: int = 32
+
+        # Bounded pool of Order operation workers
+        self.order_operation_concurrency: int = order_operation_concurrency
+        self.order_operation_queue: DeduplicatingWorkQueue = DeduplicatingWorkQueue()
+        for _ in range(self.order_operation_concurrency):
+            asyncio.get_event_loop().create_task(
+                self.order_operation_worker()
+                )
 
     async def periodic_window_flag(self) -> None:
         """
-        Randomly creates and modifies able_to_order_operate
-        flag as so the Order Operation coroutine knows
-        when it is able to act.
+        Emits the REFRESH_WINDOW trigger after each randomly
+        sized refresh window, requoting every RFQ.
+        In MARK_MOVE mode RFQs are requoted on mark moves instead.
         """
+        if self.order_requote_mode == OrderRequoteMode.MARK_MOVE:
+            return
+
         while True:
             window: float = uniform(
                 self.order_refresh_window_lower_boundary,
                 self.order_refresh_window_upper_boundary
                 )
 
-            self.able_to_order_operate = True
+            self.ingest_order_operation_trigger(
+                trigger=OrderOperationTrigger.REFRESH_WINDOW,
+                rfq_id=None
+                )
 
             await asyncio.sleep(window)
 
+    def ingest_order_operation_trigger(
+        self,
+        trigger: OrderOperationTrigger,
+        rfq_id: str
+            ) -> None:
+        """
+        Decides if an RFQ event requires an Order operation.
+        - Refresh window: requote every RFQ.
+        - New RFQ / Mark Price: quote RFQs without a live or in flight Order.
+        - Order ack: requote RFQs deferred while an operation was in flight.
+        - Mark Price (MARK_MOVE mode): requote RFQs whose marks moved.
+        - RFQ closed: drop the RFQ's requote state.
+        """
+        if trigger == OrderOperationTrigger.REFRESH_WINDOW:
+            self.request_order_operation(
+                rfq_ids=self.managed_rfqs.rfqs
+                )
+            return
+
+        if trigger == OrderOperationTrigger.ORDER_ACK:
+            if rfq_id in self.deferred_rfq_ids:
+                self.deferred_rfq_ids.discard(rfq_id)
+                self.request_order_operation(
+                    rfq_ids=[rfq_id]
+                    )
+            return
+
+        if trigger == OrderOperationTrigger.RFQ_CLOSED:
+            self.deferred_rfq_ids.discard(rfq_id)
+            self.requote_mark_ticks.pop(rfq_id, None)
+            self.requoted_at.pop(rfq_id, None)
+            timer: Optional[asyncio.TimerHandle] = self.requote_timers.pop(rfq_id, None)
+            if timer is not None:
+                timer.cancel()
+            return
+
+        rfq: Optional[RFQ] = self.managed_rfqs.rfqs.get(rfq_id)
+        if rfq is None:
+            return
+
+        if trigger == OrderOperationTrigger.MARK_PRICE and \
+                self.order_requote_mode == OrderRequoteMode.MARK_MOVE and \
+                self.has_mark_moved(rfq=rfq):
+            self.schedule_requote(
+                rfq_id=rfq_id
+                )
+            return
+
+        for order in rfq.orders.values():
+            if order.is_create_required():
+                self.request_order_operation(
+                    rfq_ids=[rfq_id]
+                    )
+                return
+
+    def has_mark_moved(
+        self,
+        rfq: RFQ
+            ) -> bool:
+        """
+        Returns True if any leg mark moved at least
+        order_requote_mark_move_ticks since the last requote.
+        """
+        requote_mark_ticks: Optional[Dict[str, int]] = self.requote_mark_ticks.get(rfq.id)
+        if requote_mark_ticks is None:
+            return True
+
+        for instrument_id, leg in rfq.legs.items():
+            if leg.mark_price_ticks is None:
+                continue
+            mark_ticks: Optional[int] = requote_mark_ticks.get(instrument_id)
+            if mark_ticks is None:
+                return True
+            if abs(leg.mark_price_ticks - mark_ticks) >= self.order_requote_mark_move_ticks:
+                return True
+        return False
+
+    def schedule_requote(
+        self,
+        rfq_id: str
+            ) -> None:
+        """
+        Requotes the RFQ now, or once order_requote_min_interval
+        has passed since its last requote.
+        """
+        if rfq_id in self.requote_timers:
+            return
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        delay: float = self.order_requote_min_interval - (
+            loop.time() - self.requoted_at.get(rfq_id, float('-inf'))
+            )
+        if delay <= 0:
+            self.requote_rfq(rfq_id=rfq_id)
+        else:
+            self.requote_timers[rfq_id] = loop.call_later(
+                delay,
+                self.requote_rfq,
+                rfq_id
+                )
+
+    def requote_rfq(
+        self,
+        rfq_id: str
+            ) -> None:
+        """
+        Records the marks requoted upon and requests
+        an Order operation for the RFQ.
+        """
+        self.requote_timers.pop(rfq_id, None)
+        rfq: Optional[RFQ] = self.managed_rfqs.rfqs.get(rfq_id)
+        if rfq is None:
+            return
+
+        self.requote_mark_ticks[rfq_id] = {
+            instrument_id: leg.mark_price_ticks
+            for instrument_id, leg in rfq.legs.items() if leg.mark_price_ticks is not None
+            }
+        self.requoted_at[rfq_id] = asyncio.get_event_loop().time()
+        self.request_order_operation(
+            rfq_ids=[rfq_id]
+            )
+
     async def is_order_operation_active(
         self,
         rfq: RFQ,
@@ -246,36 +443,88 @@ class MakerOrderManager(OrderManager):
         """
         Returns True if an Order operation is already under way.
         """
-        order: Order = rfq.orders[order_direction]
-        return True if order.order_operation_flag else False
+        return rfq.orders[order_direction].is_in_flight()
 
     async def order_operation_request(self) -> None:
         """
         Organizes and calls the manage_order_operation_request
         coroutine for the user role in the Trade.
         """
-        for rfq_id, rfq in self.managed_rfqs.rfqs.items():
+        rfq_ids: Set[str] = self.pop_pending_rfq_ids()
+
+        batched_rfq_ids: Dict[OrderDirection, Set[str]] = {}
+        if self.batch_leg_pricer is not None and len(rfq_ids) >= self.batch_pricing_min_rfqs:
+            batched_rfq_ids = self.batch_price_rfqs(
+                rfq_ids=rfq_ids
+                )
+
+        for rfq_id in rfq_ids:
             # Randomize Order side operated upon
             first_side: OrderDirection = choice(list(OrderDirection))
             second_side: OrderDirection = OrderDirection.BUY if first_side == OrderDirection.SELL else OrderDirection.SELL
             sides_order: List[OrderDirection] = [first_side, second_side]
 
             for side in sides_order:
-                asyncio.get_event_loop().create_task(
-                    self.manage_order_operation_request(
-                        rfq_id=rfq_id,
-                        order_direction=side
-                        )
+                self.order_operation_queue.put_nowait(
+                    key=(rfq_id, side),
+                    value=rfq_id in batched_rfq_ids.get(side, ())
+                    )
+
+    async def order_operation_worker(self) -> None:
+        """
+        Serves queued (rfq_id, order_direction) Order operations
+        so at most order_operation_concurrency run at once.
+        """
+        while True:
+            (rfq_id, order_direction), prices_batched = await self.order_operation_queue.get()
+            try:
+                await self.manage_order_operation_request(
+                    rfq_id=rfq_id,
+                    order_direction=order_direction,
+                    prices_batched=prices_batched
                     )
+            except Exception:
+                logging.exception(f'Order operation failed | RFQ Id: {rfq_id} | Side: {order_direction}')
+
+    def batch_price_rfqs(
+        self,
+        rfq_ids: Iterable[str]
+            ) -> Dict[OrderDirection, Set[str]]:
+        """
+        Prices the legs of every quotable RFQ, per Order
+        direction, in one vectorized pass each.
 
-        # Trigger off ability to Order Operate until
-        # Pricing Window triggers it back on
-        self.able_to_order_operate = False
+        Returns the ids of the RFQs priced per Order direction.
+        """
+        rfqs: List[RFQ] = []
+        for rfq_id in rfq_ids:
+            rfq: Optional[RFQ] = self.managed_rfqs.rfqs.get(rfq_id)
+            if rfq is None or rfq.state != RFQState.OPEN:
+                continue
+            if any(leg.mark_price_ticks is None for leg in rfq.legs.values()):
+                continue
+            rfqs.append(rfq)
+
+        batched_rfq_ids: Dict[OrderDirection, Set[str]] = {}
+        for order_direction in OrderDirection:
+            priced_rfqs: List[RFQ] = [
+                rfq for rfq in rfqs if self.is_order_operation_required(
+                    rfq=rfq,
+                    order=rfq.orders[order_direction]
+                    )
+                ]
+            self.batch_leg_pricer.price(
+                rfqs=priced_rfqs,
+                order_direction=order_direction
+                )
+            batched_rfq_ids[order_direction] = {rfq.id for rfq in priced_rfqs}
+        return batched_rfq_ids
 
     async def manage_order_operation_request(
         self,
         rfq_id: str,
-        order_direction: OrderDirection
+        order_direction: OrderDirection,
+        prices_batched: bool = False
             ) -> None:
         """
         - Validate if it's appropriate to submit an Order.
@@ -285,10 +534,9 @@ class MakerOrderManager(OrderManager):
         if await self.is_mmp_triggered():
             return None
 
-        if rfq_id not in list(self.managed_rfqs.rfqs):
+        rfq: Optional[RFQ] = self.managed_rfqs.rfqs.get(rfq_id)
+        if rfq is None:
             return None
-        else:
-            rfq: RFQ = self.managed_rfqs.rfqs[rfq_id]
 
         if not await self.is_rfq_active(
             rfq=rfq
@@ -299,6 +547,8 @@ class MakerOrderManager(OrderManager):
             rfq=rfq,
             order_direction=order_direction
                 ):
+            # Requote once the in flight operation is acknowledged
+            self.deferred_rfq_ids.add(rfq_id)
             return None
 
         if not await self.is_pricing_available(
@@ -306,59 +556,158 @@ class MakerOrderManager(OrderManager):
                 ):
             return None
 
-        order_payload: Dict = await self.create_order_payload(
+        is_create_operation: bool = await self.is_create_operation(
             rfq=rfq,
             order_direction=order_direction
             )
 
-        is_create_operation: bool = await self.is_create_operation(
+        order: Order = rfq.orders[order_direction]
+        if not is_create_operation and not self.is_replace_material(
             rfq=rfq,
-            order_direction=order_direction
+            order=order
+                ):
+            self.suppressed_replace_count += 1
+            return None
+
+        mark_ticks: Dict[str, int] = self.get_mark_price_ticks(
+            rfq=rfq
+            )
+        order_payload: Dict = await self.create_order_payload(
+            rfq=rfq,
+            order_direction=order_direction,
+            prices_batched=prices_batched
             )
 
-        if rfq_id not in list(self.managed_rfqs.rfqs):
+        if rfq_id not in self.managed_rfqs.rfqs:
             return None
 
-        self.managed_rfqs.rfqs[rfq_id].orders[order_direction].order_operation_flag = True
+        try:
+            if is_create_operation:
+                order.begin_create()
+                self.sent_create_count += 1
+                status_code, response = await self.rest_client.post_orders(
+                    payload=order_payload
+                    )
+                # logging.info(f'RFQ ID: {rfq_id} | Create {order_direction.name} Order | Status Code: {status_code}')
+            else:
+                order.begin_replace()
+                self.sent_replace_count += 1
+                status_code, response = await self.rest_client.put_orders_replace(
+                    payload=order_payload,
+                    order_id=order.order_id
+                    )
+                # logging.info(f'RFQ ID: {rfq_id} | Replace {order_direction.name} Order | Status Code: {status_code}')
+        except Exception:
+            order.abort_operation()
+            raise
+
+        order.ingest_operation_response(
+            status_code=status_code,
+            response=response
+            )
 
-        if is_create_operation:
-            status_code, response = await self.rest_client.post_orders(
-                payload=order_payload
-                )
-            # logging.info(f'RFQ ID: {rfq_id} | Create {order_direction.name} Order | Status Code: {status_code}')
-        else:
-            status_code, response = await self.rest_client.put_orders_replace(
-                payload=order_payload,
-                order_id=rfq.orders[order_direction].order_id
-                )
-            # logging.info(f'RFQ ID: {rfq_id} | Replace {order_direction.name} Order | Status Code: {status_code}')
+        if status_code in [200, 201]:
+            order.acknowledged_mark_ticks = mark_ticks
 
         if status_code == 400:
-            if response['code'] in [3009, 3001]:
-                self.managed_rfqs.rfqs[rfq_id].orders[order_direction].reset_order_id()
-            elif response['code'] in [2001]:
-                if rfq_id in list(self.managed_rfqs.rfqs):
+            if response['code'] in [2001]:
+                if rfq_id in self.managed_rfqs.rfqs:
                     await self.managed_rfqs.remove_closed_rfq(
-                        rfq=self.managed_rfqs.rfqs[rfq_id]
+                        rfq=rfq
                         )
-            elif response['code'] in [3504]:
+            elif response['code'] in [3009, 3001, 3504]:
                 pass
             else:
                 logging.info(f'Is Create Request: {is_create_operation}')
                 logging.info(f'Status Code: {status_code} | Response: {response}')
 
-        if rfq_id not in list(self.managed_rfqs.rfqs):
+        if rfq_id not in self.managed_rfqs.rfqs:
             return None
 
-        self.managed_rfqs.rfqs[rfq_id].orders[order_direction].order_operation_flag = False
+        # The Order is settled, pipeline any deferred requote
+        self.ingest_order_operation_trigger(
+            trigger=OrderOperationTrigger.ORDER_ACK,
+            rfq_id=rfq_id
+            )
+
+    def get_mark_price_ticks(
+        self,
+        rfq: RFQ
+            ) -> Dict[str, int]:
+        """
+        Returns the non hedge leg marks [ticks].
+        """
+        return {
+            instrument_id: leg.mark_price_ticks
+            for instrument_id, leg in rfq.legs.items() if not leg.hedge_leg_flag
+            }
+
+    def is_replace_material(
+        self,
+        rfq: RFQ,
+        order: Order
+            ) -> bool:
+        """
+        Returns True if any leg mark moved more than
+        order_replace_tick_threshold ticks since the
+        last acknowledged Order was priced.
+
+        Marks, not prices, are compared as the random
+        pricing offset differs on every requote.
+        """
+        if order.acknowledged_mark_ticks is None:
+            return True
+
+        for instrument_id, leg in rfq.legs.items():
+            if leg.hedge_leg_flag:
+                continue
+            acknowledged_ticks: Optional[int] = order.acknowledged_mark_ticks.get(instrument_id)
+            if acknowledged_ticks is None:
+                return True
+            if abs(leg.mark_price_ticks - acknowledged_ticks) > self.order_replace_tick_threshold:
+                return True
+        return False
+
+    def is_order_operation_required(
+        self,
+        rfq: RFQ,
+        order: Order
+            ) -> bool:
+        """
+        Returns True if the Order is idle and would be
+        created or materially replaced.
+        """
+        if order.is_in_flight():
+            return False
+        return order.is_create_required() or self.is_replace_material(
+            rfq=rfq,
+            order=order
+            )
+
+    def order_operation_stats(self) -> Dict[str, int]:
+        """
+        Returns the Order operation counters.
+        """
+        return {
+            'sent_create': self.sent_create_count,
+            'sent_replace': self.sent_replace_count,
+            'suppressed_replace': self.suppressed_replace_count,
+            'queue_depth': self.order_operation_queue.qsize(),
+            'queue_max_depth': self.order_operation_queue.max_depth,
+            'queue_superseded': self.order_operation_queue.superseded_count
+            }
 
     async def create_order_payload(
         self,
         rfq: RFQ,
-        order_direction: OrderDirection
+        order_direction: OrderDirection,
+        prices_batched: bool = False
             ) -> Dict:
         """
         Creates Order Payload to be sent to Paradigm.
+        Uses the leg prices recorded by the BatchLegPricer
+        if prices_batched, unless the leg's mark has moved
+        since, as the Order may have waited in the queue.
         """
         # Base
         order_payload: Dict = {
@@ -372,15 +721,24 @@ class MakerOrderManager(OrderManager):
                                 "side": order_direction.name
                                 }
         # Add legs to Order Payload
-        for instrument_id, leg in self.managed_rfqs.rfqs[rfq.id].legs.items():
-            price: float = await self.create_leg_price(
-                order_direction=order_direction,
-                leg=leg
-                )
-            self.managed_rfqs.rfqs[rfq.id].legs[instrument_id].update_order_price(
-                order_direction=order_direction,
-                order_price=price
-                )
+        for instrument_id, leg in rfq.legs.items():
+            if leg.hedge_leg_flag:
+                price: str = leg.price
+            else:
+                if prices_batched and leg.batch_mark_price_ticks == leg.mark_price_ticks:
+                    price_ticks: int = leg.batch_buy_price_ticks if order_direction == OrderDirection.BUY \
+                        else leg.batch_sell_price_ticks
+                else:
+                    price_ticks: int = await self.create_leg_price(
+                        order_direction=order_direction,
+                        leg=leg
+                        )
+                leg.update_order_price(
+                    order_direction=order_direction,
+                    order_price_ticks=price_ticks
+                    )
+                # Convert to the wire string only here
+                price: str = leg.tick_scale.to_price(price_ticks)
             order_payload['legs'].append(
                 {
                     'instrument_id': instrument_id,
@@ -411,26 +769,40 @@ class TakerOrderManager(OrderManager):
 
     async def increment_order_operation_count(self) -> None:
         """
-        Increments the order_operation_count variable as well as
-        toggles the able_to_order_operate variable.
+        Increments the order_operation_count variable.
         """
         self.order_operation_count += 1
 
-        if self.order_operation_count >= 2:
-            self.able_to_order_operate = False
-
     async def periodic_window_flag(self) -> None:
         """
-        Randomly creates and modifies able_to_order_operate
-        flag as so the Order Operation coroutine knows
-        when it is able to act.
+        Emits the REFRESH_WINDOW trigger every 5 seconds and
+        resets the order_operation_count of the window.
 
         Takers are only able to execute 2 times every 5 seconds.
         """
         while True:
-            self.able_to_order_operate = True
+            self.order_operation_count = 0
+            self.ingest_order_operation_trigger(
+                trigger=OrderOperationTrigger.REFRESH_WINDOW,
+                rfq_id=None
+                )
             await asyncio.sleep(5)
 
+    def ingest_order_operation_trigger(
+        self,
+        trigger: OrderOperationTrigger,
+        rfq_id: str
+            ) -> None:
+        """
+        Decides if an RFQ event requires an Order operation.
+
+        Takers only act upon the refresh window.
+        """
+        if trigger == OrderOperationTrigger.REFRESH_WINDOW:
+            self.request_order_operation(
+                rfq_ids=self.managed_rfqs.rfqs
+                )
+
     async def is_order_operation_active(
         self,
         rfq: RFQ
@@ -438,14 +810,14 @@ class TakerOrderManager(OrderManager):
         """
         Returns True if an Order operation is already under way.
         """
-        return True if rfq.order_operation_flag else False
+        return any(order.is_in_flight() for order in rfq.orders.values())
 
     async def order_operation_request(self) -> None:
         """
         Organizes and calls the manage_order_operation_request
         coroutine for the user role in the Trade.
         """
-        pass
+        self.pop_pending_rfq_ids()
         # for rfq_id, rfq in self.managed_rfqs.rfqs.items():
         #     # Randomize Order side operated upon
         #     side: OrderDirection = choice(list(OrderDirection))
@@ -509,10 +881,9 @@ class TakerOrderManager(OrderManager):
         - Create Order Payload.
         - Submit Order Operation to Paradigm.
         """
-        if rfq_id not in list(self.managed_rfqs.rfqs):
+        rfq: Optional[RFQ] = self.managed_rfqs.rfqs.get(rfq_id)
+        if rfq is None:
             return None
-        else:
-            rfq: RFQ = self.managed_rfqs.rfqs[rfq_id]
 
         if not await self.is_rfq_active(
             rfq=rfq
@@ -524,6 +895,10 @@ class TakerOrderManager(OrderManager):
                 ):
             return None
 
+        # Takers are only able to execute 2 times every window
+        if self.order_operation_count >= 2:
+            return None
+
         if not await self.is_rfq_order_available(
             rfq=rfq,
             order_direction=order_direction
@@ -540,23 +915,24 @@ class TakerOrderManager(OrderManager):
         if not order_payload:
             return None
 
-        if rfq_id not in list(self.managed_rfqs.rfqs):
+        if rfq_id not in self.managed_rfqs.rfqs:
             return None
 
-        self.managed_rfqs.rfqs[rfq_id].order_operation_flag = True
+        order: Order = rfq.orders[order_direction]
+        order.begin_create()
 
-        status_code, response = await self.rest_client.post_orders(
-            payload=order_payload
-            )
-        # logging.info(f'RFQ ID: {rfq_id} | Create {order_direction.name} Order | Status Code: {status_code}')
+        try:
+            status_code, response = await self.rest_client.post_orders(
+                payload=order_payload
+                )
+            # logging.info(f'RFQ ID: {rfq_id} | Create {order_direction.name} Order | Status Code: {status_code}')
+        finally:
+            # FILL_OR_KILL Orders never rest on the book
+            order.abort_operation()
+            order.mark_dead()
 
         if status_code == 201:
             await self.increment_order_operation_count()
 
         # if status_code == 400:
         #     logging.info(f'Status Code: {status_code} | Response: {response}')
-
-        if rfq_id not in list(self.managed_rfqs.rfqs):
-            return None
-
-        self.managed_rfqs.rfqs[rfq_id].order_operation_flag = False
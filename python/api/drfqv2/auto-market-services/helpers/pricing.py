@@ -0,0 +1,101 @@
+"""
+    Batched leg pricing for the MakerOrderManager.
+
+    Prices every non hedge leg of many RFQs for one Order
+    direction in a single vectorized pass. NumPy is optional,
+    without it the OrderManager prices leg by leg.
+"""
+
+# built ins
+from operator import attrgetter
+from typing import Dict, List
+
+try:
+    # installed
+    import numpy as np
+except ImportError:
+    np = None
+
+# project
+from helpers.constants import OrderDirection
+from helpers.resources import RFQ, RFQLeg
+
+NUMPY_AVAILABLE: bool = np is not None
+
+_SIDE_SIGNS: Dict[OrderDirection, int] = {
+    OrderDirection.BUY: -1,
+    OrderDirection.SELL: 1
+    }
+_get_side = attrgetter('side')
+_get_mark_price_ticks = attrgetter('mark_price_ticks')
+_get_buy_order_price_ticks = attrgetter('buy_order_price_ticks')
+_get_sell_order_price_ticks = attrgetter('sell_order_price_ticks')
+
+
+class BatchLegPricer:
+    """
+    Vectorized equivalent of OrderManager.create_leg_price.
+    """
+    def __init__(
+        self,
+        order_pricing_tick_multiple: int
+            ) -> None:
+        self.order_pricing_tick_multiple: int = order_pricing_tick_multiple
+
+        # Instance Variables
+        self.rng = np.random.default_rng()
+
+    def price(
+        self,
+        rfqs: List[RFQ],
+        order_direction: OrderDirection
+            ) -> None:
+        """
+        Prices the non hedge legs [ticks] of the RFQs specified
+        and records them as the legs' batch order_direction prices,
+        along with the mark they were priced from. The legs' order
+        prices are only updated once an Order is sent.
+        """
+        legs: List[RFQLeg] = [
+            leg for rfq in rfqs for leg in rfq.legs.values() if not leg.hedge_leg_flag
+            ]
+        if not legs:
+            return
+
+        # Columns are gathered with C level map() calls
+        mark: np.ndarray = np.fromiter(
+            map(_get_mark_price_ticks, legs), dtype=np.int64, count=len(legs)
+            )
+        # BUY legs price below the mark, SELL legs above
+        sign: np.ndarray = np.fromiter(
+            map(_SIDE_SIGNS.__getitem__, map(_get_side, legs)), dtype=np.int64, count=len(legs)
+            )
+        # Last price of the opposite side of each leg, 0 if none
+        buy_last: np.ndarray = np.array(list(map(_get_buy_order_price_ticks, legs)), dtype=np.float64)
+        sell_last: np.ndarray = np.array(list(map(_get_sell_order_price_ticks, legs)), dtype=np.float64)
+        opposite: np.ndarray = np.nan_to_num(
+            np.where(sign < 0, sell_last, buy_last), nan=0
+            ).astype(np.int64)
+
+        multiple: np.ndarray = self.rng.integers(
+            self.order_pricing_tick_multiple // 2,
+            self.order_pricing_tick_multiple,
+            size=len(legs),
+            endpoint=True
+            )
+
+        price: np.ndarray = mark + sign * multiple
+        # Do not cross the opposite side's last price
+        crossed: np.ndarray = (opposite > 0) & (sign * (price - opposite) >= 0)
+        price = np.where(crossed, opposite + sign * multiple, price)
+        price = np.where(price <= 0, mark, price)
+        price = np.where(price <= 0, 1, price)
+
+        if order_direction == OrderDirection.BUY:
+            for leg, price_ticks in zip(legs, price.tolist()):
+                leg.batch_buy_price_ticks = price_ticks
+        else:
+            for leg, price_ticks in zip(legs, price.tolist()):
+                leg.batch_sell_price_ticks = price_ticks
+        for leg, mark_ticks in zip(legs, mark.tolist()):
+            leg.batch_mark_price_ticks = mark_ticks
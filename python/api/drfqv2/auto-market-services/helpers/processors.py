@@ -1,10 +1,12 @@
 # built ins
 import asyncio
-import json
 from typing import Dict, Optional
+import logging
 
 # project
+from helpers.dispatchers import ChannelDispatcher
 from helpers.managers import ManagedRFQs, ManagedMMP
+from helpers.queues import PrioritizedMessageQueue
 
 
 class ParadigmWSMessageProcessor:
@@ -15,14 +17,26 @@ class ParadigmWSMessageProcessor:
     """
     def __init__(
         self,
-        message_queue: asyncio.Queue,
+        message_queue: PrioritizedMessageQueue,
         managed_rfqs: ManagedRFQs,
         managed_mmp: Optional[ManagedMMP] = None
             ) -> None:
-        self.message_queue: asyncio.Queue = message_queue
+        self.message_queue: PrioritizedMessageQueue = message_queue
         self.managed_rfqs: ManagedRFQs = managed_rfqs
         self.managed_mmp: Optional[ManagedMMP] = managed_mmp
 
+        # Instance Variables
+        self.dispatcher: ChannelDispatcher = ChannelDispatcher()
+
+        # Register WebSocket channel handlers
+        self.managed_rfqs.register_channel_handlers(
+            dispatcher=self.dispatcher
+            )
+        if self.managed_mmp:
+            self.managed_mmp.register_channel_handlers(
+                dispatcher=self.dispatcher
+                )
+
         # Instantiate WebSocket message ingestor
         asyncio.get_event_loop().create_task(
             self.ingestor()
@@ -33,18 +47,14 @@ class ParadigmWSMessageProcessor:
         Coroutine to ingest & call related resources.
         """
         while True:
-            msg: str = await self.message_queue.get()
-            msg: Dict = json.loads(msg)
+            msg: Dict = await self.message_queue.get()
 
-            ws_channel: str = msg['params']['channel']
-
-            if ws_channel == 'market_maker_protection':
-                await self.managed_mmp.ingest_ws_message(
-                    message=msg
-                    )
-            else:
-                await self.managed_rfqs.ingest_ws_message(
+            try:
+                await self.dispatcher.dispatch(
                     message=msg
                     )
+            except Exception:
+                # A failing handler must not stop the ingestor
+                logging.exception(f'Unable to process WebSocket message: {msg!r:.200}')
 
             await asyncio.sleep(0)
@@ -0,0 +1,206 @@
+# built ins
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+# project
+from helpers.constants import MessageLane
+
+
+# rfqs share the ORDERS lane so an RFQ is always ingested
+# before the orders and rfq_orders events which follow it
+DEFAULT_CHANNEL_LANES: Dict[str, MessageLane] = {
+    'market_maker_protection': MessageLane.MMP,
+    'rfqs': MessageLane.ORDERS,
+    'orders': MessageLane.ORDERS,
+    'rfq_orders': MessageLane.ORDERS,
+    'bbo': MessageLane.MARKET_DATA
+    }
+
+
+class PrioritizedMessageQueue:
+    """
+    Queue of decoded WebSocket messages between the
+    WebSocket client and the message processor.
+
+    Messages are put on a lane by channel prefix and the
+    highest priority non-empty lane is always served first,
+    so MMP, RFQ and Order events never wait behind market data.
+    Each lane keeps strict FIFO order.
+
+    Messages on conflated lanes, e.g. bbo.{rfq_id}, are keyed
+    by channel: a newer message replaces the pending one in
+    place so only the latest payload per RFQ is applied.
+    """
+    def __init__(
+        self,
+        channel_lanes: Optional[Dict[str, MessageLane]] = None,
+        conflated_lanes: FrozenSet[MessageLane] = frozenset({MessageLane.MARKET_DATA}),
+        default_lane: MessageLane = MessageLane.RFQS
+            ) -> None:
+        self.channel_lanes: Dict[str, MessageLane] = channel_lanes or DEFAULT_CHANNEL_LANES
+        self.conflated_lanes: FrozenSet[MessageLane] = conflated_lanes
+        self.default_lane: MessageLane = default_lane
+
+        # Instance Variables
+        self.lanes: Dict[MessageLane, Deque[Tuple[Optional[str], List[Dict]]]] = {
+            lane: deque() for lane in MessageLane
+            }
+        self.pending_conflated_entries: Dict[str, List[Dict]] = {}
+        self.size: int = 0
+        self.not_empty: asyncio.Event = asyncio.Event()
+
+        # Counters
+        self.conflated_count: int = 0
+        self.max_lane_depths: Dict[MessageLane, int] = {
+            lane: 0 for lane in MessageLane
+            }
+
+    def resolve_lane(
+        self,
+        channel: str
+            ) -> MessageLane:
+        """
+        Returns the lane of the channel.
+        """
+        return self.channel_lanes.get(
+            channel.split('.', 1)[0],
+            self.default_lane
+            )
+
+    def put_nowait(
+        self,
+        message: Dict
+            ) -> None:
+        """
+        Puts a message on its lane, replacing the pending
+        message of the channel if the lane is conflated.
+        """
+        channel: str = message['params']['channel']
+        lane: MessageLane = self.resolve_lane(channel=channel)
+        entries: Deque[Tuple[Optional[str], List[Dict]]] = self.lanes[lane]
+
+        if lane in self.conflated_lanes:
+            entry: Optional[List[Dict]] = self.pending_conflated_entries.get(channel)
+            if entry is not None:
+                entry[0] = message
+                self.conflated_count += 1
+                return
+
+            entry = [message]
+            self.pending_conflated_entries[channel] = entry
+            entries.append((channel, entry))
+        else:
+            entries.append((None, [message]))
+
+        self.size += 1
+        if len(entries) > self.max_lane_depths[lane]:
+            self.max_lane_depths[lane] = len(entries)
+
+        self.not_empty.set()
+
+    async def get(self) -> Dict:
+        """
+        Waits for and returns the next message of the
+        highest priority non-empty lane.
+        """
+        while not self.size:
+            self.not_empty.clear()
+            await self.not_empty.wait()
+
+        for lane in MessageLane:
+            entries: Deque[Tuple[Optional[str], List[Dict]]] = self.lanes[lane]
+            if entries:
+                break
+
+        channel, entry = entries.popleft()
+        self.size -= 1
+        if channel is not None:
+            self.pending_conflated_entries.pop(channel, None)
+        return entry[0]
+
+    def qsize(self) -> int:
+        """
+        Returns the number of pending messages.
+        """
+        return self.size
+
+    def empty(self) -> bool:
+        """
+        Returns True if there are no pending messages.
+        """
+        return not self.size
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Returns the current and maximum depth of each lane
+        and the number of conflated messages.
+        """
+        return {
+            'depth': {lane.name: len(self.lanes[lane]) for lane in MessageLane},
+            'max_depth': {lane.name: self.max_lane_depths[lane] for lane in MessageLane},
+            'conflated': self.conflated_count
+            }
+
+
+class DeduplicatingWorkQueue:
+    """
+    FIFO queue of keyed work items shared by a pool of workers.
+
+    Putting a key which is already queued replaces its value
+    but keeps its position, so a newer request supersedes the
+    queued one without jumping ahead of other keys.
+    """
+    def __init__(self) -> None:
+        # Instance Variables
+        self.items: Dict[Hashable, Any] = {}
+        self.not_empty: asyncio.Event = asyncio.Event()
+
+        # Counters
+        self.superseded_count: int = 0
+        self.max_depth: int = 0
+
+    def put_nowait(
+        self,
+        key: Hashable,
+        value: Any = None
+            ) -> None:
+        """
+        Queues the key, superseding its queued value if any.
+        """
+        if key in self.items:
+            self.superseded_count += 1
+        self.items[key] = value
+
+        if len(self.items) > self.max_depth:
+            self.max_depth = len(self.items)
+
+        self.not_empty.set()
+
+    async def get(self) -> Tuple[Hashable, Any]:
+        """
+        Waits for and returns the oldest queued key and its value.
+        """
+        while not self.items:
+            self.not_empty.clear()
+            await self.not_empty.wait()
+
+        key: Hashable = next(iter(self.items))
+        return key, self.items.pop(key)
+
+    def qsize(self) -> int:
+        """
+        Returns the number of queued keys.
+        """
+        return len(self.items)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the current and maximum depth and
+        the number of superseded items.
+        """
+        return {
+            'depth': len(self.items),
+            'max_depth': self.max_depth,
+            'superseded': self.superseded_count
+            }
@@ -0,0 +1,235 @@
+# built ins
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+import time
+
+# project
+from helpers.constants import RateLimitClass, RequestPriority
+
+
+# Requests per second and burst capacity per endpoint class.
+# MMP resets share the ORDERS bucket so they can jump ahead of quotes.
+DEFAULT_RATE_LIMITS: Dict[RateLimitClass, Tuple[float, float]] = {
+    RateLimitClass.ORDERS: (20, 20),
+    RateLimitClass.RFQS: (5, 5),
+    RateLimitClass.INSTRUMENTS: (5, 5)
+    }
+
+
+class TokenBucket:
+    """
+    Async token bucket that refills continuously. Waiters
+    are parked on futures and released by a scheduled
+    wake-up, in priority order, so no coroutine spins
+    while the bucket is empty.
+    """
+    def __init__(
+        self,
+        rate: float,
+        capacity: float
+            ) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity
+
+        # Instance Variables
+        self.tokens: float = capacity
+        self.updated_at: float = time.monotonic()
+        self.waiters: Dict[RequestPriority, Deque[asyncio.Future]] = {
+            priority: deque() for priority in RequestPriority
+            }
+        self.wake_up_handle: Optional[asyncio.TimerHandle] = None
+
+        # Counters
+        self.acquired_count: int = 0
+        self.waited_count: int = 0
+        self.throttled_count: int = 0
+
+    def _refill(self) -> None:
+        """
+        Adds the tokens accrued since the last refill.
+        """
+        now: float = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated_at) * self.rate
+            )
+        self.updated_at = now
+
+    def _has_waiters(self) -> bool:
+        """
+        Returns True if any coroutine is waiting for a token.
+        """
+        return any(self.waiters[priority] for priority in RequestPriority)
+
+    def _schedule_wake_up(self) -> None:
+        """
+        Schedules a single wake-up for when the next
+        token will be available.
+        """
+        if self.wake_up_handle is not None or not self._has_waiters():
+            return
+
+        delay: float = max(0, (1 - self.tokens) / self.rate)
+        self.wake_up_handle = asyncio.get_event_loop().call_later(
+            delay,
+            self._wake_up
+            )
+
+    def _wake_up(self) -> None:
+        """
+        Hands available tokens to waiters, highest priority first.
+        """
+        self.wake_up_handle = None
+        self._refill()
+
+        for priority in RequestPriority:
+            waiters: Deque[asyncio.Future] = self.waiters[priority]
+            while waiters and self.tokens >= 1:
+                waiter: asyncio.Future = waiters.popleft()
+                if waiter.done():
+                    continue
+                self.tokens -= 1
+                waiter.set_result(None)
+
+        self._schedule_wake_up()
+
+    async def acquire(
+        self,
+        priority: RequestPriority = RequestPriority.NORMAL
+            ) -> None:
+        """
+        Waits until a token is available and consumes it.
+        """
+        self.acquired_count += 1
+        self._refill()
+
+        if self.tokens >= 1 and not self._has_waiters():
+            self.tokens -= 1
+            return
+
+        self.waited_count += 1
+        waiter: asyncio.Future = asyncio.get_event_loop().create_future()
+        self.waiters[priority].append(waiter)
+        self._schedule_wake_up()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Token was handed over as we were cancelled
+                self.tokens += 1
+            elif waiter in self.waiters[priority]:
+                self.waiters[priority].remove(waiter)
+            raise
+
+    def throttle(self) -> None:
+        """
+        Empties the bucket after the venue rejected a
+        request for exceeding its rate limit.
+        """
+        self.throttled_count += 1
+        self._refill()
+        self.tokens = min(self.tokens, 0)
+        self._schedule_wake_up()
+
+    def stats(self) -> Dict:
+        """
+        Returns counters used to monitor the bucket.
+        """
+        return {
+            'tokens': round(self.tokens, 2),
+            'waiting': sum(len(self.waiters[priority]) for priority in RequestPriority),
+            'acquired': self.acquired_count,
+            'waited': self.waited_count,
+            'throttled': self.throttled_count
+            }
+
+
+class RateLimiter(ABC):
+    """
+    Interface for the async rate limiting layer used
+    by the VenueRESTClient.
+    """
+    @abstractmethod
+    async def acquire(
+        self,
+        rate_limit_class: RateLimitClass,
+        priority: RequestPriority = RequestPriority.NORMAL
+            ) -> None:
+        """
+        Waits until a request of the class may be sent.
+        """
+        pass
+
+    @abstractmethod
+    def record_response(
+        self,
+        rate_limit_class: RateLimitClass,
+        status_code: int
+            ) -> None:
+        """
+        Feeds the response status back to the limiter.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Returns counters used to monitor the limiter.
+        """
+        pass
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Rate limiter with one TokenBucket per endpoint class.
+    """
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[RateLimitClass, Tuple[float, float]]] = None
+            ) -> None:
+        rate_limits = rate_limits or DEFAULT_RATE_LIMITS
+
+        # Instance Variables
+        self.buckets: Dict[RateLimitClass, TokenBucket] = {
+            rate_limit_class: TokenBucket(rate=rate, capacity=capacity)
+            for rate_limit_class, (rate, capacity) in rate_limits.items()
+            }
+
+    async def acquire(
+        self,
+        rate_limit_class: RateLimitClass,
+        priority: RequestPriority = RequestPriority.NORMAL
+            ) -> None:
+        """
+        Waits until a request of the class may be sent.
+        """
+        bucket: Optional[TokenBucket] = self.buckets.get(rate_limit_class)
+        if bucket is None:
+            return
+        await bucket.acquire(priority=priority)
+
+    def record_response(
+        self,
+        rate_limit_class: RateLimitClass,
+        status_code: int
+            ) -> None:
+        """
+        Empties the class bucket on a 429 response.
+        """
+        if status_code != 429:
+            return
+        bucket: Optional[TokenBucket] = self.buckets.get(rate_limit_class)
+        if bucket is not None:
+            bucket.throttle()
+
+    def stats(self) -> Dict[str, Dict]:
+        """
+        Returns the counters of every bucket.
+        """
+        return {
+            rate_limit_class.name: bucket.stats()
+            for rate_limit_class, bucket in self.buckets.items()
+            }
@@ -1,15 +1,18 @@
 # built ins
-from typing import Dict
+from typing import Dict, Optional
 
 # project
 from helpers.constants import InstrumentState, RFQState, \
-     OrderDirection, VenueInterface
+     OrderDirection, VenueInterface, OrderState, OrderStatus
+from helpers.ticks import TickScale, get_tick_scale
 
 
 class RFQOrder:
     """
     Object to represent a Paradigm RFQ Order.
     """
+    __slots__ = ('id', 'rfq_id', 'order_direction', 'price', 'quantity')
+
     def __init__(
         self,
         id: str,
@@ -28,7 +31,22 @@ class RFQOrder:
 class Order:
     """
     Object to represent a Paradigm Order.
+
+    status is driven by both the REST responses to the
+    user's Order operations and orders WS channel events:
+    - IDLE/DEAD -> CREATING -> LIVE
+    - LIVE -> REPLACING -> LIVE
+    - LIVE -> DEAD once the Order is CLOSED.
+    - A failed operation returns to LIVE, or IDLE
+    without an order_id.
+    - CREATING/REPLACING only settle from the REST
+    response of their operation.
     """
+    __slots__ = (
+        'rfq_id', 'order_direction', 'order_id', 'status',
+        'created_at', 'acknowledged_mark_ticks'
+        )
+
     def __init__(
         self,
         rfq_id: str,
@@ -38,22 +56,137 @@ class Order:
         self.order_direction: OrderDirection = order_direction
 
         # Instance Variables
-        self.order_id: str = None
-        self.order_operation_flag: bool = False
-        self.created_at: float = None
+        self.order_id: Optional[str] = None
+        self.status: OrderStatus = OrderStatus.IDLE
+        self.created_at: Optional[float] = None
+        # Leg marks [ticks] the last acknowledged Order operation was priced from
+        self.acknowledged_mark_ticks: Optional[Dict[str, int]] = None
+
+    def is_in_flight(self) -> bool:
+        """
+        Returns True if an Order operation awaits its response.
+        """
+        return self.status in (OrderStatus.CREATING, OrderStatus.REPLACING)
+
+    def is_create_required(self) -> bool:
+        """
+        Returns True if there is no Order to replace.
+        """
+        return self.status in (OrderStatus.IDLE, OrderStatus.DEAD)
+
+    def begin_create(self) -> None:
+        """
+        Marks a create operation as in flight.
+        """
+        self.status = OrderStatus.CREATING
 
-    def reset_order_id(self) -> None:
+    def begin_replace(self) -> None:
         """
-        Sets the order_id instance attribute to None.
-        Used in the case of code == 3009 errors.
+        Marks a replace operation as in flight.
         """
+        self.status = OrderStatus.REPLACING
+
+    def abort_operation(self) -> None:
+        """
+        Settles the in flight Order operation without
+        changing the Order.
+        """
+        self.status = OrderStatus.LIVE if self.order_id else OrderStatus.IDLE
+
+    def mark_dead(self) -> None:
+        """
+        Forgets the Order once it is no longer OPEN,
+        so the next operation is a create.
+        - Ignored while an operation is in flight, which
+        settles from its REST response instead.
+        """
+        if self.is_in_flight():
+            return
+
+        self._forget()
+
+    def _forget(self) -> None:
+        self.status = OrderStatus.DEAD
         self.order_id = None
+        self.acknowledged_mark_ticks = None
+
+    def ingest_operation_response(
+        self,
+        status_code: int,
+        response: Dict
+            ) -> None:
+        """
+        Settles the in flight Order operation from
+        its REST response.
+        - 200/201: the Order is LIVE with the returned id.
+        - 3009/3001: the Order is no longer OPEN.
+        - Otherwise the Order is unchanged.
+        """
+        if status_code in [200, 201]:
+            self.order_id = response.get('id', self.order_id)
+            self.created_at = response.get('created_at', self.created_at)
+            self.abort_operation()
+        elif status_code == 400 and response.get('code') in [3009, 3001]:
+            self._forget()
+        else:
+            self.abort_operation()
+
+    def ingest_order_update(
+        self,
+        message: Dict
+            ) -> None:
+        """
+        Ingests a raw Order object of the user.
+        - OPEN updates of another Order only apply if newer
+        and no operation is in flight, which settles from
+        its REST response instead.
+        - CLOSED updates only end the live Order, not the
+        one superseded by a replace.
+        """
+        if message.get('state') == OrderState.CLOSED.name:
+            if message['id'] == self.order_id and self.status == OrderStatus.LIVE:
+                self.mark_dead()
+            return
+
+        if self.order_id is not None and message['id'] != self.order_id:
+            if self.is_in_flight() or message['created_at'] <= (self.created_at or 0):
+                return
+
+        self.created_at = message['created_at']
+        self.order_id = message['id']
+        if self.is_create_required():
+            self.status = OrderStatus.LIVE
 
 
 class Instrument:
     """
     Object to represent a Paradigm Instrument.
     """
+    __slots__ = (
+        'id', 'name', 'venue', 'kind', 'base_currency', 'expires_at',
+        'venue_name', 'min_tick_size', 'min_order_size_increment',
+        'min_block_size', 'state', 'mark_price', 'price_precision',
+        'tick_scale'
+        )
+
+    def __init__(self) -> None:
+        self.id: Optional[str] = None
+        self.name: Optional[str] = None
+        self.venue: Optional[str] = None
+        self.kind: Optional[str] = None
+        self.base_currency: Optional[str] = None
+        self.expires_at: Optional[float] = None
+        self.venue_name: Optional[str] = None
+        self.min_tick_size: Optional[float] = None
+        self.min_order_size_increment: Optional[float] = None
+        self.min_block_size: Optional[float] = None
+        self.state: Optional[InstrumentState] = None
+        self.mark_price: Optional[float] = None
+
+        # Instance Variables
+        self.price_precision: Optional[int] = None
+        self.tick_scale: Optional[TickScale] = None
+
     def ingest_raw_message(
         self,
         message: Dict
@@ -61,31 +194,79 @@ class Instrument:
         """
         Ingests an INSTRUMENT object.
         """
-        self.id: int = message['id']
-        self.name: str = message['name']
-        self.venue: str = message['venue']
-        self.kind: str = message['kind']
-        self.base_currency: str = message['base_currency']
-        self.expires_at: float = message['expires_at']
-        self.venue_name: str = message['venue_instrument_name']
-        self.min_tick_size: float = message['min_tick_size']
-        self.min_order_size_increment: float = float(message['min_order_size_increment'])
-        self.min_block_size: float = float(message['min_block_size'])
-        self.state: InstrumentState = InstrumentState[message['state']]
-
-        if 'greeks' in list(message):
-            if not message['greeks']:
-                self.mark_price: None = None
-            else:
-                self.mark_price: float = float(message['greeks']['mark_price'])
-        else:
-            self.mark_price: None = None
+        self.id = message['id']
+        self.name = message['name']
+        self.venue = message['venue']
+        self.kind = message['kind']
+        self.base_currency = message['base_currency']
+        self.expires_at = message['expires_at']
+        self.venue_name = message['venue_instrument_name']
+        self.min_tick_size = message['min_tick_size']
+        self.min_order_size_increment = float(message['min_order_size_increment'])
+        self.min_block_size = float(message['min_block_size'])
+        self.state = InstrumentState[message['state']]
+        self.mark_price = self.parse_mark_price(
+            message=message
+            )
 
-        # Instance Variables
-        self.price_precision: int = self.calculate_price_precision(
+        self.tick_scale = get_tick_scale(self.min_tick_size)
+        self.price_precision = self.calculate_price_precision(
             min_tick_size=self.min_tick_size
             )
 
+    def ingest_update(
+        self,
+        message: Dict
+            ) -> bool:
+        """
+        Applies the mutable fields of an INSTRUMENT object
+        to an already ingested Instrument.
+
+        Returns True if any field changed.
+        """
+        state: InstrumentState = InstrumentState[message['state']]
+        mark_price: Optional[float] = self.parse_mark_price(
+            message=message
+            )
+
+        if state == self.state and mark_price == self.mark_price:
+            return False
+
+        self.state = state
+        self.mark_price = mark_price
+        return True
+
+    def to_raw_message(self) -> Dict:
+        """
+        Returns the compact INSTRUMENT object of the
+        Instrument, accepted by ingest_raw_message.
+        """
+        return {
+            'id': self.id,
+            'name': self.name,
+            'venue': self.venue,
+            'kind': self.kind,
+            'base_currency': self.base_currency,
+            'expires_at': self.expires_at,
+            'venue_instrument_name': self.venue_name,
+            'min_tick_size': self.min_tick_size,
+            'min_order_size_increment': self.min_order_size_increment,
+            'min_block_size': self.min_block_size,
+            'state': self.state.name,
+            'greeks': {'mark_price': self.mark_price} if self.mark_price is not None else None
+            }
+
+    @staticmethod
+    def parse_mark_price(message: Dict) -> Optional[float]:
+        """
+        Returns the mark_price from the greeks of an
+        INSTRUMENT object, None if not included.
+        """
+        greeks: Optional[Dict] = message.get('greeks')
+        if not greeks:
+            return None
+        return float(greeks['mark_price'])
+
     def calculate_price_precision(
         self,
         min_tick_size: float
@@ -94,39 +275,59 @@ class Instrument:
         Determines the number of decimal places from
         the min_tick_size attribute of the Instrument.
         """
-        return len(str(min_tick_size).split('.')[1])
+        return get_tick_scale(min_tick_size).precision
 
 
 class RFQLeg:
     """
     Object to represent a Paradigm RFQ Leg.
     """
-    def ingest_raw_message(
-        self,
-        message: Dict
-            ) -> None:
-        self.id: int = message['instrument_id']
-        self.side: OrderDirection = OrderDirection[message['side']]
-        if 'price' in list(message):
-            if message['price'] is not None:
-                self.hedge_leg_flag: bool = True
-                self.price: float = message['price']
-            else:
-                self.hedge_leg_flag: bool = False
-                self.price: None = None
-        else:
-            self.hedge_leg_flag: bool = False
-            self.price: None = None
+    __slots__ = (
+        'id', 'side', 'hedge_leg_flag', 'price',
+        'buy_order_price_ticks', 'sell_order_price_ticks',
+        'batch_buy_price_ticks', 'batch_sell_price_ticks',
+        'batch_mark_price_ticks', 'mark_price_ticks', 'min_price', 'max_price',
+        'min_tick_size', 'min_order_size_increment',
+        'min_block_size', 'price_precision', 'tick_scale'
+        )
 
-        # Order price
-        self.buy_order_price: float = None
-        self.sell_order_price: float = None
+    def __init__(self) -> None:
+        self.id: Optional[str] = None
+        self.side: Optional[OrderDirection] = None
+        self.hedge_leg_flag: bool = False
+        self.price: Optional[float] = None
+
+        # Order price [ticks]
+        self.buy_order_price_ticks: Optional[int] = None
+        self.sell_order_price_ticks: Optional[int] = None
+        # Prices [ticks] of the BatchLegPricer and the mark they were priced from
+        self.batch_buy_price_ticks: Optional[int] = None
+        self.batch_sell_price_ticks: Optional[int] = None
+        self.batch_mark_price_ticks: Optional[int] = None
 
         # BBO
-        self.mark_price: float = ''
+        self.mark_price_ticks: Optional[int] = None
         self.min_price: float = ''
         self.max_price: float = ''
 
+        # Instrument attributes
+        self.min_tick_size: Optional[float] = None
+        self.min_order_size_increment: Optional[float] = None
+        self.min_block_size: Optional[float] = None
+        self.price_precision: Optional[int] = None
+        self.tick_scale: Optional[TickScale] = None
+
+    def ingest_raw_message(
+        self,
+        message: Dict
+            ) -> None:
+        self.id = message['instrument_id']
+        self.side = OrderDirection[message['side']]
+        price: Optional[float] = message.get('price')
+        if price is not None:
+            self.hedge_leg_flag = True
+            self.price = price
+
     def add_attributes(
         self,
         instrument: Instrument
@@ -135,10 +336,22 @@ class RFQLeg:
         Adds Instrument attributes to the RFQLeg object
         to ensure the OrderManager can price appropriately.
         """
-        self.min_tick_size: float = instrument.min_tick_size
-        self.min_order_size_increment: float = instrument.min_order_size_increment
-        self.min_block_size: float = instrument.min_block_size
-        self.price_precision: int = instrument.price_precision
+        self.min_tick_size = instrument.min_tick_size
+        self.min_order_size_increment = instrument.min_order_size_increment
+        self.min_block_size = instrument.min_block_size
+        self.price_precision = instrument.price_precision
+        self.tick_scale = instrument.tick_scale
+
+    def update_mark_price(
+        self,
+        mark_price: str
+            ) -> None:
+        """
+        Stores the mark price rounded to the nearest tick.
+        """
+        if self.tick_scale is None:
+            return
+        self.mark_price_ticks = self.tick_scale.to_ticks(mark_price)
 
     def update_bbo(
         self,
@@ -147,31 +360,42 @@ class RFQLeg:
         """
 
         """
-        self.mark_price: float = ''
-        self.min_price: float = ''
-        self.max_price: float = ''
+        self.mark_price_ticks = None
+        self.min_price = ''
+        self.max_price = ''
 
     def update_order_price(
         self,
         order_direction: OrderDirection,
-        order_price: float
+        order_price_ticks: int
             ) -> None:
         """
         Updates a price attribute used to represent
-        the last price used in an order for the leg.
+        the last price [ticks] used in an order for the leg.
         """
         if order_direction == OrderDirection.BUY:
-            self.buy_order_price = order_price
+            self.buy_order_price_ticks = order_price_ticks
         else:
-            self.sell_order_price = order_price
+            self.sell_order_price_ticks = order_price_ticks
 
 
 class RFQ:
     """
     Object to manage a Paradigm RFQ.
     """
+    __slots__ = (
+        'id', 'state', 'quantity', 'side_layering_limit',
+        'legs', 'orders', 'rfq_orders'
+        )
+
     def __init__(self) -> None:
-        self.order_operation_flag: bool = False
+        self.id: Optional[str] = None
+        self.state: Optional[RFQState] = None
+        self.quantity: Optional[str] = None
+        self.side_layering_limit: Optional[int] = None
+        self.legs: Dict[str, RFQLeg] = {}
+        self.orders: Dict[OrderDirection, Order] = {}
+        self.rfq_orders: Dict[OrderDirection, Dict[str, RFQOrder]] = {}
 
     def ingest_raw_message(
         self,
@@ -184,11 +408,11 @@ class RFQ:
         if venue_interface == VenueInterface.WS:
             message = message['params']['data']
 
-        self.id: str = message['id']
-        self.state: RFQState = RFQState[message['state']]
-        self.quantity: str = message['quantity']
-        self.side_layering_limit: int = message['side_layering_limit']
-        self.legs: Dict[str, RFQLeg] = {}
+        self.id = message['id']
+        self.state = RFQState[message['state']]
+        self.quantity = message['quantity']
+        self.side_layering_limit = message['side_layering_limit']
+        self.legs = {}
         for leg in message['legs']:
             rfq_leg: RFQLeg = RFQLeg()
             rfq_leg.ingest_raw_message(
@@ -196,9 +420,9 @@ class RFQ:
                 )
             self.legs[rfq_leg.id] = rfq_leg
 
-        self.orders: Dict[OrderDirection, Order] = self.create_user_orders()
+        self.orders = self.create_user_orders()
 
-        self.rfq_orders: Dict[OrderDirection, Dict[str, RFQOrder]] = self.create_rfq_orders()
+        self.rfq_orders = self.create_rfq_orders()
 
     def create_user_orders(self) -> Dict[OrderDirection, Order]:
         """
@@ -231,15 +455,28 @@ class RFQ:
 
     def ingest_order_update(
         self,
-        message: Dict
+        message: Dict,
+        venue_interface: VenueInterface
             ) -> None:
         """
         Ingests an update about an Order for the user.
         """
-        order_direction: OrderDirection = OrderDirection[message['params']['data']['side']]
+        if venue_interface == VenueInterface.WS:
+            message = message['params']['data']
 
-        self.orders[order_direction].created_at = message['params']['data']['created_at']
-        self.orders[order_direction].order_id = message['params']['data']['id']
+        order_direction: OrderDirection = OrderDirection[message['side']]
+
+        self.orders[order_direction].ingest_order_update(
+            message=message
+            )
+
+    def reset_order_ids(self) -> None:
+        """
+        Marks the user's BUY and SELL Orders DEAD,
+        except those with an operation in flight.
+        """
+        for order in self.orders.values():
+            order.mark_dead()
 
     def ingest_rfq_order_update(
         self,
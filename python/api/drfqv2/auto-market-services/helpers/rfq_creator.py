@@ -1,13 +1,13 @@
 # built ins
 import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 from random import randint, choice
 
 # project
 from helpers.managers import ManagedInstruments
 from interface_clients.rest import ParadigmRESTClient
-from helpers.constants import OrderDirection
+from helpers.constants import OrderDirection, LifecycleState
 from helpers.resources import Instrument
 
 
@@ -34,8 +34,9 @@ class RFQCreator:
         """
         Waits until the initial [GET] `/instruments` request is finished.
         """
-        while len(list(self.managed_instruments.instruments)) < 50:
-            await asyncio.sleep(0)
+        await self.managed_instruments.lifecycle.wait_for(
+            LifecycleState.INSTRUMENTS_LOADED
+            )
 
     async def determine_supported_venues(self) -> List[str]:
         """
@@ -70,28 +71,21 @@ class RFQCreator:
         venue: str,
         kind: str,
         base_currency: str
-            ) -> Instrument:
+            ) -> Optional[Instrument]:
         """
-        Returns a random Instrument id.
+        Returns a random Instrument matching the venue, kind
+        and base_currency, None if there is none.
         """
-        while True:
-            instrument_id: str = choice(list(self.managed_instruments.instruments))
-            instrument: Instrument = self.managed_instruments.instruments[instrument_id]
-
-            if instrument.venue != venue:
-                continue
-
-            if instrument.base_currency != base_currency:
-                continue
-
-            if instrument.kind != kind:
-                continue
-
-            return instrument
+        return self.managed_instruments.choose_random_instrument(
+            venue=venue,
+            kind=kind,
+            base_currency=base_currency
+            )
 
-    async def create_random_payload(self) -> Dict:
+    async def create_random_payload(self) -> Optional[Dict]:
         """
         Creates random RFQ Create Payload.
+        Returns None if no Instrument matches.
         """
         venue: str = choice(self.supported_venues)
         kind: str = await self.choose_random_instrument_kind()
@@ -107,6 +101,9 @@ class RFQCreator:
                 kind=kind,
                 base_currency=base_currency
                 )
+            if instrument is None:
+                logging.info(f'No Instruments | Venue: {venue} | Kind: {kind} | Base Currency: {base_currency}')
+                return None
             random_instruments.append(instrument)
             quantity: float = instrument.min_block_size
 
@@ -149,8 +146,13 @@ class RFQCreator:
         self.supported_base_currencies: List[str] = ['BTC', 'ETH']
 
         while True:
+            payload: Optional[Dict] = await self.create_random_payload()
+            if payload is None:
+                await asyncio.sleep(60)
+                continue
+
             status_code, response = await self.rest_client.post_rfq(
-                    payload=await self.create_random_payload()
+                    payload=payload
                     )
             if status_code != 201:
                 logging.info(f'RFQ Create Status Code: {status_code} | Response: {response}')
@@ -0,0 +1,84 @@
+# built ins
+import json
+import logging
+import os
+import time
+from typing import Dict, List
+
+# project
+from helpers.json_backend import loads
+
+
+class InstrumentSnapshot:
+    """
+    On-disk snapshot of raw INSTRUMENT objects used to
+    warm start ManagedInstruments.
+
+    Layout:
+    {"version": 1, "saved_at": <ms>, "instruments": [<INSTRUMENT>, ...]}
+    """
+    VERSION: int = 1
+
+    def __init__(
+        self,
+        path: str,
+        max_age: float = 86400
+            ) -> None:
+        self.path: str = path
+        self.max_age: float = max_age
+
+    def load(self) -> List[Dict]:
+        """
+        Returns the raw INSTRUMENT objects of the snapshot.
+        - Returns [] if missing, unreadable, malformed, of
+        another version or older than max_age [s].
+        - Drops Instruments which have since expired.
+        """
+        try:
+            with open(self.path, 'rb') as snapshot_file:
+                snapshot: Dict = loads(snapshot_file.read())
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logging.info(f'Unable to read Instrument snapshot {self.path} | {e}')
+            return []
+
+        if not isinstance(snapshot, dict) or snapshot.get('version') != self.VERSION:
+            logging.info(f'Ignoring Instrument snapshot {self.path} | Unknown version')
+            return []
+
+        now: float = time.time() * 1000
+        try:
+            age: float = (now - snapshot['saved_at']) / 1000
+            if age > self.max_age:
+                logging.info(f'Ignoring Instrument snapshot {self.path} | Age: {age:.0f}s')
+                return []
+
+            return [
+                instrument for instrument in snapshot['instruments']
+                if not instrument['expires_at'] or instrument['expires_at'] > now
+                ]
+        except (KeyError, TypeError) as e:
+            logging.info(f'Ignoring Instrument snapshot {self.path} | Malformed: {e!r}')
+            return []
+
+    def save(
+        self,
+        instruments: List[Dict]
+            ) -> None:
+        """
+        Atomically replaces the snapshot with
+        the raw INSTRUMENT objects specified.
+        """
+        snapshot: Dict = {
+            'version': self.VERSION,
+            'saved_at': int(time.time() * 1000),
+            'instruments': instruments
+            }
+        tmp_path: str = f'{self.path}.tmp'
+        try:
+            with open(tmp_path, 'w') as snapshot_file:
+                json.dump(snapshot, snapshot_file, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.info(f'Unable to write Instrument snapshot {self.path} | {e}')
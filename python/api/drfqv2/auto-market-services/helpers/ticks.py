@@ -0,0 +1,57 @@
+# built ins
+from decimal import Decimal
+from functools import lru_cache
+from typing import Union
+
+
+class TickScale:
+    """
+    Integer tick representation of an Instrument's prices.
+    - Prices are held as a whole number of min_tick_sizes.
+    - Wire strings are built exactly from integers.
+    """
+    __slots__ = ('precision', 'denominator', 'tick_units', 'tick_size')
+
+    def __init__(
+        self,
+        min_tick_size: Union[str, float]
+            ) -> None:
+        tick_size: Decimal = Decimal(str(min_tick_size))
+
+        # Number of decimal places, e.g. 0.0005 -> 4, 1e-05 -> 5, 2.5 -> 1
+        self.precision: int = max(-tick_size.normalize().as_tuple().exponent, 0)
+        self.denominator: int = 10 ** self.precision
+        # min_tick_size in units of 10^-precision, e.g. 0.0005 -> 5
+        self.tick_units: int = int(tick_size * self.denominator)
+        self.tick_size: float = float(tick_size)
+
+    def to_ticks(
+        self,
+        price: Union[str, float]
+            ) -> int:
+        """
+        Returns the price rounded to the nearest whole tick.
+        """
+        return round(float(price) / self.tick_size)
+
+    def to_price(
+        self,
+        ticks: int
+            ) -> str:
+        """
+        Returns the exact decimal string of a tick count.
+        """
+        units: int = ticks * self.tick_units
+        sign: str = '-' if units < 0 else ''
+        whole, fraction = divmod(abs(units), self.denominator)
+        if not self.precision:
+            return f'{sign}{whole}'
+        return f'{sign}{whole}.{fraction:0{self.precision}d}'
+
+
+@lru_cache(maxsize=None)
+def get_tick_scale(min_tick_size: Union[str, float]) -> TickScale:
+    """
+    Returns the shared TickScale of a min_tick_size.
+    """
+    return TickScale(min_tick_size=min_tick_size)
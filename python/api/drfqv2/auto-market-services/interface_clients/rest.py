@@ -6,7 +6,7 @@
 import asyncio
 import os
 from abc import ABC
-from typing import Dict, Tuple, List, Optional
+from typing import AsyncIterator, Dict, Tuple, List, Optional
 import time
 import base64
 import hmac
@@ -18,7 +18,8 @@ import aiohttp
 
 # project
 from helpers.constants import RFQState, InstrumentState, \
-     VenueInterface, OrderState
+     VenueInterface, OrderState, RateLimitClass, RequestPriority
+from helpers.rate_limiter import RateLimiter, TokenBucketRateLimiter
 from helpers.resources import RFQ, Instrument
 
 
@@ -27,119 +28,205 @@ class VenueRESTClient(ABC):
         self,
         connection_url: str,
         access_key: str,
-        secret_key: str
+        secret_key: str,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30,
+        rate_limiter: Optional[RateLimiter] = None
             ) -> None:
         self.connection_url: str = connection_url
         self.access_key: str = access_key
         self.secret_key: str = secret_key
+        self.connection_limit: int = connection_limit
+        self.connection_limit_per_host: int = connection_limit_per_host
+        self.dns_cache_ttl: int = dns_cache_ttl
+        self.keepalive_timeout: float = keepalive_timeout
+        self.rate_limiter: RateLimiter = rate_limiter or TokenBucketRateLimiter()
+
+        # Instance Variables
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> 'VenueRESTClient':
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the long-lived ClientSession, creating it on first
+        use so every request reuses the same keep-alive connection
+        pool rather than paying a new TCP + TLS handshake.
+        """
+        if self.session is None or self.session.closed:
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout
+                )
+            self.session = aiohttp.ClientSession(
+                connector=connector
+                )
+        return self.session
+
+    async def close(self) -> None:
+        """
+        Closes the ClientSession and its pooled connections.
+        """
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def _acquire(
+        self,
+        rate_limit_class: RateLimitClass,
+        priority: RequestPriority = RequestPriority.NORMAL
+            ) -> None:
+        """
+        Waits for the rate limiter to allow a request of
+        the endpoint class. Must be awaited before the request
+        is signed so the signature timestamp stays fresh.
+        """
+        await self.rate_limiter.acquire(
+            rate_limit_class=rate_limit_class,
+            priority=priority
+            )
+
+    def _record_response(
+        self,
+        rate_limit_class: Optional[RateLimitClass],
+        status_code: int
+            ) -> None:
+        """
+        Feeds the response status back to the rate limiter.
+        """
+        if rate_limit_class is None:
+            return
+        self.rate_limiter.record_response(
+            rate_limit_class=rate_limit_class,
+            status_code=status_code
+            )
 
     async def _get_request(
         self,
         endpoint: str,
         headers: Dict,
-        cursor: str = None
+        cursor: str = None,
+        rate_limit_class: Optional[RateLimitClass] = None
             ) -> Tuple[int, Dict]:
         """
         Aysnc method for [GET] requests.
 
         Returns HTTP Status Code and Response.
         """
-        async with aiohttp.ClientSession() as session:
-            try:
-                url: str = f'{self.connection_url}{endpoint}'
-                if cursor:
-                    url += f'?{cursor}'
-                async with session.get(
-                    url,
-                    headers=headers
-                        ) as response:
-                    status_code: int = response.status
-                    response: Dict = await response.json()
-            finally:
-                await session.close()
+        session: aiohttp.ClientSession = await self._get_session()
+        url: str = f'{self.connection_url}{endpoint}'
+        if cursor:
+            url += f'?{cursor}'
+        async with session.get(
+            url,
+            headers=headers
+                ) as response:
+            status_code: int = response.status
+            self._record_response(
+                rate_limit_class=rate_limit_class,
+                status_code=status_code
+                )
+            response: Dict = await response.json()
         return status_code, response
 
     async def _post_request(
         self,
         endpoint: str,
         headers: Dict,
-        payload: Dict
+        payload: Dict,
+        rate_limit_class: Optional[RateLimitClass] = None
             ) -> Tuple[int, Dict]:
         """
         Aysnc method for [POST] requests.
 
         Returns HTTP Status Code and Response.
         """
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                    self.connection_url+endpoint,
-                    headers=headers,
-                    json=payload
-                        ) as response:
-                    status_code: int = response.status
-                    response: Dict = await response.json()
-            except aiohttp.ContentTypeError:
-                logging.info(f'POST request Error | Status Code: {status_code}')
-            finally:
-                await session.close()
+        session: aiohttp.ClientSession = await self._get_session()
+        try:
+            async with session.post(
+                self.connection_url+endpoint,
+                headers=headers,
+                json=payload
+                    ) as response:
+                status_code: int = response.status
+                self._record_response(
+                    rate_limit_class=rate_limit_class,
+                    status_code=status_code
+                    )
+                response: Dict = await response.json()
+        except aiohttp.ContentTypeError:
+            logging.info(f'POST request Error | Status Code: {status_code}')
         return status_code, response
 
     async def _put_request(
         self,
         endpoint: str,
         headers: Dict,
-        payload: Dict
+        payload: Dict,
+        rate_limit_class: Optional[RateLimitClass] = None
             ) -> Tuple[int, Dict]:
         """
         Aysnc method for [PUT] requests.
 
         Returns HTTP Status Code and Response.
         """
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.put(
-                    self.connection_url+endpoint,
-                    headers=headers,
-                    json=payload
-                        ) as response:
-                    status_code: int = response.status
-                    response: Dict = await response.json()
-            except aiohttp.ClientConnectionError:
-                response: Dict = {}
-                logging.info(f'PUT Request ClientConnectionError Status Code: {status_code}')
-            except aiohttp.ClientConnectorError:
-                response: Dict = {}
-                logging.info(f'PUT Request ClientConnectorError Status Code: {status_code}')
-            except aiohttp.ContentTypeError:
-                response: Dict = {}
-                logging.info(f'PUT Request ContentTypeError Status Code: {status_code}')
-            finally:
-                await session.close()
+        session: aiohttp.ClientSession = await self._get_session()
+        try:
+            async with session.put(
+                self.connection_url+endpoint,
+                headers=headers,
+                json=payload
+                    ) as response:
+                status_code: int = response.status
+                self._record_response(
+                    rate_limit_class=rate_limit_class,
+                    status_code=status_code
+                    )
+                response: Dict = await response.json()
+        except aiohttp.ClientConnectionError:
+            response: Dict = {}
+            logging.info(f'PUT Request ClientConnectionError Status Code: {status_code}')
+        except aiohttp.ClientConnectorError:
+            response: Dict = {}
+            logging.info(f'PUT Request ClientConnectorError Status Code: {status_code}')
+        except aiohttp.ContentTypeError:
+            response: Dict = {}
+            logging.info(f'PUT Request ContentTypeError Status Code: {status_code}')
         return status_code, response
 
     async def _patch_request(
         self,
         endpoint: str,
         headers: Dict,
-        payload: Dict
+        payload: Dict,
+        rate_limit_class: Optional[RateLimitClass] = None
             ) -> Tuple[int, Dict]:
         """
         Aysnc method for [PATCH] requests.
 
         Returns HTTP Status Code and Response.
         """
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.patch(
-                    self.connection_url+endpoint,
-                    headers=headers,
-                    json=payload
-                        ) as response:
-                    status_code: int = response.status
-                    response: Dict = await response.json()
-            finally:
-                await session.close()
+        session: aiohttp.ClientSession = await self._get_session()
+        async with session.patch(
+            self.connection_url+endpoint,
+            headers=headers,
+            json=payload
+                ) as response:
+            status_code: int = response.status
+            self._record_response(
+                rate_limit_class=rate_limit_class,
+                status_code=status_code
+                )
+            response: Dict = await response.json()
         return status_code, response
 
 
@@ -191,63 +278,123 @@ class ParadigmRESTClient(VenueRESTClient):
                 'Authorization': f'Bearer {self.access_key}'
                 }
 
-    async def paginate_endpoint(
+    async def _get_page(
         self,
         method: str,
-        endpoint: str
-            ) -> List[Dict]:
+        endpoint: str,
+        rate_limit_class: RateLimitClass
+            ) -> Tuple[int, Dict]:
         """
-        Paginates the requested endpoint and returns
-        the raw responses until no more are available.
+        Requests a single page of a paginated endpoint,
+        paced by the rate limiter at LOW priority.
         """
-        # Initial Request
+        await self._acquire(
+            rate_limit_class=rate_limit_class,
+            priority=RequestPriority.LOW
+            )
         headers: Dict = self.create_headers(
             method=method,
             endpoint=endpoint
             )
 
-        status_code, response = await self._get_request(
+        return await self._get_request(
             endpoint=endpoint,
-            headers=headers
+            headers=headers,
+            rate_limit_class=rate_limit_class
             )
-        if status_code != 200:
-            logging.info(f'{method} {endpoint} | Status Code: {status_code}')
-            return []
 
-        result: List[Dict] = [x for x in response['results']]
-        cursor: str = response['next']
+    async def iter_paginate_endpoint(
+        self,
+        method: str,
+        endpoint: str,
+        rate_limit_class: RateLimitClass
+            ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """
+        Paginates the requested endpoint and yields the
+        HTTP Status Code and raw results of each page.
 
-        # Paginated Requests
-        while cursor is not None:
-            await asyncio.sleep(1)
-            cursor_endpoint: str = f'{endpoint}&cursor={cursor}'
-            headers: Dict = self.create_headers(
+        The next page is requested as soon as the current
+        page's cursor is known, so fetching page N+1 overlaps
+        with the consumer processing page N. Stops after the
+        first non 200 response.
+        """
+        page_task: Optional[asyncio.Task] = asyncio.get_event_loop().create_task(
+            self._get_page(
                 method=method,
-                endpoint=cursor_endpoint
-                )
-
-            status_code, response = await self._get_request(
-                endpoint=cursor_endpoint,
-                headers=headers
+                endpoint=endpoint,
+                rate_limit_class=rate_limit_class
                 )
+            )
+        try:
+            while page_task is not None:
+                status_code, response = await page_task
+                page_task = None
+
+                if status_code != 200:
+                    logging.info(f'{method} {endpoint} | Status Code: {status_code}')
+                    yield status_code, []
+                    return
+
+                cursor: str = response['next']
+                if cursor is not None:
+                    # Prefetch the next page
+                    page_task = asyncio.get_event_loop().create_task(
+                        self._get_page(
+                            method=method,
+                            endpoint=f'{endpoint}&cursor={cursor}',
+                            rate_limit_class=rate_limit_class
+                            )
+                        )
+
+                yield status_code, response['results']
+        finally:
+            if page_task is not None:
+                page_task.cancel()
 
+    async def paginate_endpoint(
+        self,
+        method: str,
+        endpoint: str,
+        rate_limit_class: RateLimitClass
+            ) -> List[Dict]:
+        """
+        Paginates the requested endpoint and returns
+        the raw responses until no more are available.
+        """
+        result: List[Dict] = []
+        async for status_code, results in self.iter_paginate_endpoint(
+            method=method,
+            endpoint=endpoint,
+            rate_limit_class=rate_limit_class
+                ):
             if status_code != 200:
-                logging.info(f'{method} {endpoint} | Status Code: {status_code}')
                 return []
-
-            for element in response['results']:
-                result.append(element)
-            cursor: str = response['next']
+            result.extend(results)
         return result
 
-    async def get_instruments(
+    def _create_instruments(
         self,
-        state: Optional[InstrumentState] = None
+        results: List[Dict]
             ) -> List[Instrument]:
         """
-        Requests and paginates the [GET] /instruments endpoint.
+        Creates Instrument objects from raw [GET] /instruments results.
+        """
+        instruments: List[Instrument] = []
+        for instrument in results:
+            _instrument: Instrument = Instrument()
+            _instrument.ingest_raw_message(
+                message=instrument
+                )
+            instruments.append(_instrument)
+        return instruments
+
+    def _create_instruments_endpoint(
+        self,
+        state: Optional[InstrumentState] = None
+            ) -> str:
+        """
+        Creates the paginated [GET] /instruments endpoint.
         """
-        method: str = 'GET'
         endpoint: str = '/v2/drfq/instruments'
 
         if state:
@@ -256,21 +403,51 @@ class ParadigmRESTClient(VenueRESTClient):
             endpoint = f'{endpoint}?page_size=100&include_greeks=True'
 
         # endpoint += '&kind=OPTION&base_currency=BTC&venue=DBT'
+        return endpoint
 
+    async def get_instruments(
+        self,
+        state: Optional[InstrumentState] = None
+            ) -> List[Instrument]:
+        """
+        Requests and paginates the [GET] /instruments endpoint.
+        """
         results: List[Dict] = await self.paginate_endpoint(
-            method=method,
-            endpoint=endpoint
+            method='GET',
+            endpoint=self._create_instruments_endpoint(state=state),
+            rate_limit_class=RateLimitClass.INSTRUMENTS
             )
 
-        instruments: List[Instrument] = []
-        for instrument in results:
-            _instrument: Instrument = Instrument()
-            _instrument.ingest_raw_message(
-                message=instrument
-                )
-            instruments.append(_instrument)
+        return self._create_instruments(results=results)
 
-        return instruments
+    async def iter_instrument_pages(
+        self,
+        state: Optional[InstrumentState] = None
+            ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """
+        Requests and paginates the [GET] /instruments endpoint,
+        yielding the HTTP Status Code and raw results of each page.
+        """
+        async for status_code, results in self.iter_paginate_endpoint(
+            method='GET',
+            endpoint=self._create_instruments_endpoint(state=state),
+            rate_limit_class=RateLimitClass.INSTRUMENTS
+                ):
+            yield status_code, results
+
+    async def iter_instruments(
+        self,
+        state: Optional[InstrumentState] = None
+            ) -> AsyncIterator[Tuple[int, List[Instrument]]]:
+        """
+        Requests and paginates the [GET] /instruments endpoint,
+        yielding the HTTP Status Code and Instruments of each
+        page as it arrives. Stops after the first non 200 page.
+        """
+        async for status_code, results in self.iter_instrument_pages(
+            state=state
+                ):
+            yield status_code, self._create_instruments(results=results)
 
     async def get_instrument(
         self,
@@ -282,6 +459,10 @@ class ParadigmRESTClient(VenueRESTClient):
         method: str = 'GET'
         endpoint: str = f'/v2/drfq/instruments/{instrument_id}'
 
+        await self._acquire(
+            rate_limit_class=RateLimitClass.INSTRUMENTS,
+            priority=RequestPriority.NORMAL
+            )
         headers: Dict = self.create_headers(
             method=method,
             endpoint=endpoint
@@ -289,7 +470,8 @@ class ParadigmRESTClient(VenueRESTClient):
 
         status_code, response = await self._get_request(
             endpoint=endpoint,
-            headers=headers
+            headers=headers,
+            rate_limit_class=RateLimitClass.INSTRUMENTS
             )
 
         if status_code != 200:
@@ -302,36 +484,68 @@ class ParadigmRESTClient(VenueRESTClient):
             )
         return [instrument]
 
-    async def get_rfqs(
+    def _create_rfqs(
         self,
-        state: Optional[RFQState] = None
+        results: List[Dict]
             ) -> List[RFQ]:
         """
-        Requests and paginates the [GET] /rfqs endpoint.
+        Creates RFQ objects from raw [GET] /rfqs results.
+        """
+        rfqs: List[RFQ] = []
+        for rfq in results:
+            _rfq: RFQ = RFQ()
+            _rfq.ingest_raw_message(
+                message=rfq,
+                venue_interface=VenueInterface.REST
+                )
+            rfqs.append(_rfq)
+        return rfqs
+
+    def _create_rfqs_endpoint(
+        self,
+        state: Optional[RFQState] = None
+            ) -> str:
+        """
+        Creates the paginated [GET] /rfqs endpoint.
         """
-        method: str = 'GET'
         endpoint: str = '/v2/drfq/rfqs'
 
         if state:
             endpoint = f'{endpoint}?page_size=100&state={state.name}'
         else:
             endpoint = f'{endpoint}?page_size=100'
+        return endpoint
 
+    async def get_rfqs(
+        self,
+        state: Optional[RFQState] = None
+            ) -> List[RFQ]:
+        """
+        Requests and paginates the [GET] /rfqs endpoint.
+        """
         results: List[Dict] = await self.paginate_endpoint(
-            method=method,
-            endpoint=endpoint
+            method='GET',
+            endpoint=self._create_rfqs_endpoint(state=state),
+            rate_limit_class=RateLimitClass.RFQS
             )
 
-        rfqs: List[RFQ] = []
-        for rfq in results:
-            _rfq: RFQ = RFQ()
-            _rfq.ingest_raw_message(
-                message=rfq,
-                venue_interface=VenueInterface.REST
-                )
-            rfqs.append(_rfq)
+        return self._create_rfqs(results=results)
 
-        return rfqs
+    async def iter_rfqs(
+        self,
+        state: Optional[RFQState] = None
+            ) -> AsyncIterator[Tuple[int, List[RFQ]]]:
+        """
+        Requests and paginates the [GET] /rfqs endpoint,
+        yielding the HTTP Status Code and RFQs of each
+        page as it arrives. Stops after the first non 200 page.
+        """
+        async for status_code, results in self.iter_paginate_endpoint(
+            method='GET',
+            endpoint=self._create_rfqs_endpoint(state=state),
+            rate_limit_class=RateLimitClass.RFQS
+                ):
+            yield status_code, self._create_rfqs(results=results)
 
     async def post_rfq(
         self,
@@ -343,6 +557,10 @@ class ParadigmRESTClient(VenueRESTClient):
         method: str = 'POST'
         endpoint: str = '/v2/drfq/rfqs'
 
+        await self._acquire(
+            rate_limit_class=RateLimitClass.RFQS,
+            priority=RequestPriority.NORMAL
+            )
         headers: Dict = self.create_headers(
             method=method,
             endpoint=endpoint,
@@ -352,12 +570,14 @@ class ParadigmRESTClient(VenueRESTClient):
         return await self._post_request(
             endpoint=endpoint,
             headers=headers,
-            payload=payload
+            payload=payload,
+            rate_limit_class=RateLimitClass.RFQS
             )
 
     async def post_orders(
         self,
-        payload: Dict
+        payload: Dict,
+        priority: RequestPriority = RequestPriority.NORMAL
             ) -> None:
         """
         Requests the [POST] /orders endpoint.
@@ -365,6 +585,10 @@ class ParadigmRESTClient(VenueRESTClient):
         method: str = 'POST'
         endpoint: str = '/v2/drfq/orders'
 
+        await self._acquire(
+            rate_limit_class=RateLimitClass.ORDERS,
+            priority=priority
+            )
         headers: Dict = self.create_headers(
             method=method,
             endpoint=endpoint,
@@ -374,13 +598,15 @@ class ParadigmRESTClient(VenueRESTClient):
         return await self._post_request(
             endpoint=endpoint,
             headers=headers,
-            payload=payload
+            payload=payload,
+            rate_limit_class=RateLimitClass.ORDERS
             )
 
     async def put_orders_replace(
         self,
         payload: Dict,
-        order_id: str
+        order_id: str,
+        priority: RequestPriority = RequestPriority.NORMAL
             ) -> None:
         """
         Requests the [PUT] /orders/{order_id} endpoint.
@@ -388,6 +614,10 @@ class ParadigmRESTClient(VenueRESTClient):
         method: str = 'PUT'
         endpoint: str = f'/v2/drfq/orders/{order_id}'
 
+        await self._acquire(
+            rate_limit_class=RateLimitClass.ORDERS,
+            priority=priority
+            )
         headers: Dict = self.create_headers(
             method=method,
             endpoint=endpoint,
@@ -397,30 +627,53 @@ class ParadigmRESTClient(VenueRESTClient):
         return await self._put_request(
             endpoint=endpoint,
             headers=headers,
-            payload=payload
+            payload=payload,
+            rate_limit_class=RateLimitClass.ORDERS
             )
 
-    async def get_orders(
+    def _create_orders_endpoint(
         self,
         state: Optional[OrderState] = None
-            ) -> List[RFQ]:
+            ) -> str:
         """
-        Requests and paginates the [GET] /rfqs endpoint.
+        Creates the paginated [GET] /orders endpoint.
         """
-        method: str = 'GET'
         endpoint: str = '/v2/drfq/orders'
 
         if state:
             endpoint = f'{endpoint}?page_size=100&state={state.name}'
         else:
             endpoint = f'{endpoint}?page_size=100'
+        return endpoint
 
-        results: List[Dict] = await self.paginate_endpoint(
-            method=method,
-            endpoint=endpoint
+    async def get_orders(
+        self,
+        state: Optional[OrderState] = None
+            ) -> List[Dict]:
+        """
+        Requests and paginates the [GET] /orders endpoint.
+        """
+        return await self.paginate_endpoint(
+            method='GET',
+            endpoint=self._create_orders_endpoint(state=state),
+            rate_limit_class=RateLimitClass.ORDERS
             )
 
-        return results
+    async def iter_orders(
+        self,
+        state: Optional[OrderState] = None
+            ) -> AsyncIterator[Tuple[int, List[Dict]]]:
+        """
+        Requests and paginates the [GET] /orders endpoint,
+        yielding the HTTP Status Code and raw Orders of each
+        page as it arrives. Stops after the first non 200 page.
+        """
+        async for status_code, results in self.iter_paginate_endpoint(
+            method='GET',
+            endpoint=self._create_orders_endpoint(state=state),
+            rate_limit_class=RateLimitClass.ORDERS
+                ):
+            yield status_code, results
 
     async def get_mmp(self) -> bool:
         """
@@ -429,6 +682,10 @@ class ParadigmRESTClient(VenueRESTClient):
         method: str = 'GET'
         endpoint: str = '/v2/drfq/mmp/status'
 
+        await self._acquire(
+            rate_limit_class=RateLimitClass.ORDERS,
+            priority=RequestPriority.NORMAL
+            )
         headers: Dict = self.create_headers(
             method=method,
             endpoint=endpoint
@@ -436,7 +693,8 @@ class ParadigmRESTClient(VenueRESTClient):
 
         status_code, response = await self._get_request(
             endpoint=endpoint,
-            headers=headers
+            headers=headers,
+            rate_limit_class=RateLimitClass.ORDERS
             )
 
         if status_code == 200:
@@ -451,6 +709,10 @@ class ParadigmRESTClient(VenueRESTClient):
         method: str = 'PUT'
         endpoint: str = '/v2/drfq/mmp/status'
 
+        await self._acquire(
+            rate_limit_class=RateLimitClass.ORDERS,
+            priority=RequestPriority.HIGH
+            )
         headers: Dict = self.create_headers(
             method=method,
             endpoint=endpoint
@@ -459,7 +721,8 @@ class ParadigmRESTClient(VenueRESTClient):
         return await self._patch_request(
             endpoint=endpoint,
             headers=headers,
-            payload=''
+            payload='',
+            rate_limit_class=RateLimitClass.ORDERS
             )
 
 # client = ParadigmRESTClient(
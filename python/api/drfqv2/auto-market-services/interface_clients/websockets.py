@@ -5,7 +5,8 @@
 # built ins
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple, List, Optional
+from typing import Awaitable, Callable, Dict, Tuple, List, Optional
+from random import uniform
 import os
 import time
 import base64
@@ -16,35 +17,48 @@ import logging
 # installed
 import websockets
 
+# project
+from helpers import json_backend
+from helpers.constants import LifecycleState
+from helpers.lifecycle import ServiceLifecycle
+from helpers.queues import PrioritizedMessageQueue
+
 
 class VenueWebSocketClient(ABC):
     def __init__(
         self,
         connection_url: str,
         access_key: str,
-        exgest_queue: asyncio.Queue,
-        channels_to_subscribe_on_start: List[str]
+        exgest_queue: PrioritizedMessageQueue,
+        channels_to_subscribe_on_start: List[str],
+        lifecycle: Optional[ServiceLifecycle] = None,
+        reconnect_delay_min: float = 1,
+        reconnect_delay_max: float = 30
             ) -> None:
         self.connection_url: str = connection_url
         self.access_key: str = access_key
-        self.exgest_queue: asyncio.Queue = exgest_queue
+        self.exgest_queue: PrioritizedMessageQueue = exgest_queue
         self.channels_to_subscribe_on_start: List[Tuple[int, str]] = channels_to_subscribe_on_start
+        self.lifecycle: ServiceLifecycle = lifecycle or ServiceLifecycle()
+        self.reconnect_delay_min: float = reconnect_delay_min
+        self.reconnect_delay_max: float = reconnect_delay_max
 
         # Instance Variables
         self.url: str = f'{self.connection_url}?api-key={self.access_key}&cancel_on_disconnect=true'
         self.websocket_client: websockets.WebSocketClientProtocol = None
-        self.connection_authentication: bool = False
+        self.heartbeat_task: Optional[asyncio.Task] = None
+        self.connection_count: int = 0
+        # Ordered set of channels to (re)subscribe to on connection
+        self.active_subscriptions: Dict[str, None] = dict.fromkeys(
+            channels_to_subscribe_on_start
+            )
+        self.reconnect_callbacks: List[Callable[[], Awaitable[None]]] = []
 
         # Instantiate WebSocket Connection
         asyncio.get_event_loop().create_task(
             self.receiver()
             )
 
-        # Actions on WebSocket Connection
-        asyncio.get_event_loop().create_task(
-            self.operations_on_websocket_connection()
-            )
-
     @abstractmethod
     def create_operation_payload(
         self,
@@ -67,7 +81,7 @@ class VenueWebSocketClient(ABC):
     @abstractmethod
     async def operations_on_websocket_connection(self):
         """
-        Operations to instantiate upon the successful
+        Operations to instantiate upon each successful
         WebSocket connection.
         """
         pass
@@ -81,6 +95,8 @@ class VenueWebSocketClient(ABC):
         Ingest the raw message from the WebSocket
         Interface and determines if it needs to be
         processed further by the system.
+
+        Returns the decoded message if so, else an empty dict.
         """
         pass
 
@@ -96,27 +112,84 @@ class VenueWebSocketClient(ABC):
         """
         pass
 
+    def register_reconnect_callback(
+        self,
+        callback: Callable[[], Awaitable[None]]
+            ) -> None:
+        """
+        Registers a coroutine function called after every
+        successful reconnection, e.g. to resync state.
+        """
+        self.reconnect_callbacks.append(callback)
+
+    def calculate_reconnect_delay(
+        self,
+        reconnect_attempt: int
+            ) -> float:
+        """
+        Returns the exponential backoff delay with full jitter.
+        """
+        return uniform(
+            0,
+            min(
+                self.reconnect_delay_max,
+                self.reconnect_delay_min * 2 ** reconnect_attempt
+                )
+            )
+
     async def receiver(self) -> None:
         """
         - Instantiates the WebSocket Connection.
         - Receives WebSocket Connection messages.
         - Determines and if the message needs to be processed
-        is put on exgestion queue.
+        the decoded message is put on exgestion queue.
+        - Reconnects with a jittered backoff when the
+        connection is lost.
         """
-        # Instantiate WebSocket Connection
-        async with websockets.connect(
-            self.url,
-            ping_interval=None,
-            compression=None
-                ) as self.websocket_client:
-            while True:
-                message: bytes = await self.websocket_client.recv()
-                data_message: Dict = await self.initial_ingest_message(
-                    message=message
-                    )
-                if data_message:
-                    self.exgest_queue.put_nowait(message)
-                await asyncio.sleep(0)
+        reconnect_attempt: int = 0
+        while True:
+            try:
+                # Instantiate WebSocket Connection
+                async with websockets.connect(
+                    self.url,
+                    ping_interval=None,
+                    compression=None
+                        ) as self.websocket_client:
+                    reconnect_attempt = 0
+                    self.connection_count += 1
+                    self.lifecycle.set(LifecycleState.CONNECTED)
+
+                    await self.operations_on_websocket_connection()
+
+                    while True:
+                        message: bytes = await self.websocket_client.recv()
+                        try:
+                            data_message: Dict = await self.initial_ingest_message(
+                                message=message
+                                )
+                            if data_message:
+                                self.exgest_queue.put_nowait(data_message)
+                        except Exception:
+                            # A malformed message must not stop the receiver
+                            logging.exception(f'Unable to ingest WebSocket message: {message!r:.200}')
+                        await asyncio.sleep(0)
+            except (websockets.WebSocketException, OSError, asyncio.TimeoutError) as e:
+                logging.info(f'WebSocket connection lost: {e!r}')
+            except Exception:
+                logging.exception('WebSocket receiver error')
+            finally:
+                self.lifecycle.clear(LifecycleState.CONNECTED)
+                self.lifecycle.clear(LifecycleState.AUTHENTICATED)
+                if self.heartbeat_task:
+                    self.heartbeat_task.cancel()
+                    self.heartbeat_task = None
+
+            delay: float = self.calculate_reconnect_delay(
+                reconnect_attempt=reconnect_attempt
+                )
+            reconnect_attempt += 1
+            logging.info(f'WebSocket reconnecting in {delay:.2f}s')
+            await asyncio.sleep(delay)
 
     async def send_payload(
         self,
@@ -125,11 +198,15 @@ class VenueWebSocketClient(ABC):
         """
         Sends a created WebSocket Payload via the Websocket connection.
         """
-        await self.websocket_client.send(
-            json.dumps(
-                payload
+        try:
+            await self.websocket_client.send(
+                json.dumps(
+                    payload
+                    )
                 )
-            )
+        except (websockets.WebSocketException, AttributeError):
+            # Connection lost, subscriptions are replayed on reconnection
+            logging.info(f'Unable to send WebSocket payload: {payload}')
 
 
 class ParadigmWebSocketClient(VenueWebSocketClient):
@@ -169,30 +246,36 @@ class ParadigmWebSocketClient(VenueWebSocketClient):
 
     async def operations_on_websocket_connection(self) -> None:
         """
-        Operations to instantiate upon the successful
+        Operations to instantiate upon each successful
         WebSocket connection.
         """
-        while not self.websocket_client:
-            await asyncio.sleep(0)
-
         # Flag connection has been authenticated
-        self.connection_authentication = True
+        self.lifecycle.set(LifecycleState.AUTHENTICATED)
 
         # Instantiate Sending Heartbeat Coroutine
-        asyncio.get_event_loop().create_task(
+        self.heartbeat_task = asyncio.get_event_loop().create_task(
             self.send_heartbeat()
             )
 
-        # Subscribe to Initial WebSocket Channels
-        for channel in self.channels_to_subscribe_on_start:
-            # Create + Send WS Operation Request
+        # Subscribe to every active WebSocket Channel,
+        # including those added at runtime
+        for channel in list(self.active_subscriptions):
             asyncio.get_event_loop().create_task(
-                self.create_send_ws_operation(
-                    channel=channel,
-                    operation='subscribe'
+                self.send_payload(
+                    payload=self.create_operation_payload(
+                        channel=channel,
+                        ws_operation='subscribe'
+                        )
                     )
                 )
 
+        # Resync state missed while disconnected
+        if self.connection_count > 1:
+            for callback in self.reconnect_callbacks:
+                asyncio.get_event_loop().create_task(
+                    callback()
+                    )
+
     async def initial_ingest_message(
         self,
         message: str
@@ -201,8 +284,11 @@ class ParadigmWebSocketClient(VenueWebSocketClient):
         Ingest the raw message from the WebSocket
         Interface and determines if it needs to be
         processed further by the system.
+
+        The message is decoded once here and the decoded
+        message is passed on to the processor.
         """
-        processed_message: Dict = json.loads(message)
+        processed_message: Dict = json_backend.loads(message)
         if 'id' not in processed_message:
             return processed_message
         else:
@@ -214,11 +300,18 @@ class ParadigmWebSocketClient(VenueWebSocketClient):
         operation: str
             ) -> None:
         """
+        - Tracks the channel as an active subscription.
         - Creates the WebSocket payload.
         - Sends the Websocket payload via the WebSocket connection.
         """
-        while not self.connection_authentication:
-            await asyncio.sleep(0)
+        if operation == 'subscribe':
+            self.active_subscriptions[channel] = None
+        elif operation == 'unsubscribe':
+            self.active_subscriptions.pop(channel, None)
+
+        # Active subscriptions are sent upon (re)connection
+        if not self.lifecycle.is_set(LifecycleState.AUTHENTICATED):
+            return
 
         # Create Operation Payload
         payload: Dict = self.create_operation_payload(
@@ -27,10 +27,19 @@ Environment Variables:
     ORDER_PRICING_TICK_MULTIPLE - Number of min_tick_sizes to increment from the Mark Price. '0', '1', ...
     ORDER_REFRESH_WINDOW_LOWER_BOUNDARY - Lower bound of order refresh window in seconds.
     ORDER_REFRESH_WINDOW_UPPER_BOUNDARY - Upper bound of order refresh window in seconds.
+    ORDER_REPLACE_TICK_THRESHOLD - Max leg mark move in min_tick_sizes since the live Order was priced for which an Order replace is suppressed. '0', '1', ...
+    ORDER_REQUOTE_MODE - When to requote RFQs. 'REFRESH_WINDOW', 'MARK_MOVE'
+    ORDER_REQUOTE_MARK_MOVE_TICKS - Mark move in min_tick_sizes which requotes an RFQ in MARK_MOVE mode. '1', '2', ...
+    ORDER_REQUOTE_MIN_INTERVAL - Minimum seconds between requotes of an RFQ in MARK_MOVE mode.
+    ORDER_OPERATION_CONCURRENCY - Max number of concurrent Order operations. '16', '32', ...
+    INSTRUMENT_SNAPSHOT_PATH - Path of the on-disk Instrument snapshot used to warm start. '' to disable.
+                               Mount a volume at its directory to keep it across container recreation.
 
 Requirements:
     pip3 install websockets
     pip3 install aiohttp
+    pip3 install orjson (optional, faster WebSocket message decoding)
+    pip3 install numpy (optional, batched quote pricing)
 """
 
 # built ins
@@ -45,7 +54,11 @@ from helpers.managers import ManagedInstruments, MakerManagedRFQs, \
      ManagedMMP
 from helpers.order_manager import MakerOrderManager
 from helpers.processors import ParadigmWSMessageProcessor
-from helpers.constants import OrderState, RFQState
+from helpers.lifecycle import ServiceLifecycle
+from helpers.snapshots import InstrumentSnapshot
+from helpers.queues import PrioritizedMessageQueue
+from helpers.constants import OrderState, RFQState, LifecycleState, \
+     OrderRequoteMode
 
 
 class main:
@@ -62,7 +75,13 @@ class main:
         order_price_worse_than_mark_flag: str,
         order_pricing_tick_multiple: str,
         order_refresh_window_lower_boundary: str,
-        order_refresh_window_upper_boundary: str
+        order_refresh_window_upper_boundary: str,
+        order_replace_tick_threshold: str,
+        order_requote_mode: str,
+        order_requote_mark_move_ticks: str,
+        order_requote_min_interval: str,
+        order_operation_concurrency: str,
+        instrument_snapshot_path: str
             ) -> None:
         self.ws_url: str = ws_url
         self.http_url: str = http_url
@@ -81,9 +100,25 @@ class main:
         self.order_refresh_window_upper_boundary: float = float(
             order_refresh_window_upper_boundary
             )
+        self.order_replace_tick_threshold: int = int(
+            order_replace_tick_threshold
+            )
+        self.order_requote_mode: OrderRequoteMode = OrderRequoteMode[
+            order_requote_mode
+            ]
+        self.order_requote_mark_move_ticks: int = int(
+            order_requote_mark_move_ticks
+            )
+        self.order_requote_min_interval: float = float(
+            order_requote_min_interval
+            )
+        self.order_operation_concurrency: int = int(
+            order_operation_concurrency
+            )
+        self.instrument_snapshot_path: str = instrument_snapshot_path
 
         # Instance Variables
-        self.ws_msg_queue: asyncio.Queue = asyncio.Queue()
+        self.ws_msg_queue: PrioritizedMessageQueue = PrioritizedMessageQueue()
 
         # Instantiate Market Maker Coroutine
         asyncio.get_event_loop().run_until_complete(
@@ -95,6 +130,9 @@ class main:
         Primary coroutine to coordinate and manage dependencies
         to make markets.
         """
+        # Instantiate Service Lifecycle
+        self.lifecycle: ServiceLifecycle = ServiceLifecycle()
+
         # Instantiate RESToverHTTP Client
         self.rest_client: ParadigmRESTClient = ParadigmRESTClient(
             connection_url=self.http_url,
@@ -121,6 +159,7 @@ class main:
             connection_url=self.ws_url,
             access_key=self.access_key,
             exgest_queue=self.ws_msg_queue,
+            lifecycle=self.lifecycle,
             channels_to_subscribe_on_start=[
                 'rfqs',
                 'orders',
@@ -130,14 +169,19 @@ class main:
 
         # Instantiate Instrument Management Class
         self.managed_instruments: ManagedInstruments = ManagedInstruments(
-            rest_client=self.rest_client
+            rest_client=self.rest_client,
+            lifecycle=self.lifecycle,
+            snapshot=InstrumentSnapshot(
+                path=self.instrument_snapshot_path
+                ) if self.instrument_snapshot_path else None
             )
 
         # Instantiate RFQ Management Class
         self.managed_rfqs: MakerManagedRFQs = MakerManagedRFQs(
             rest_client=self.rest_client,
             ws_client=self.ws_client,
-            managed_instruments=self.managed_instruments
+            managed_instruments=self.managed_instruments,
+            lifecycle=self.lifecycle
             )
 
         # Instantiate MMP Manager
@@ -161,7 +205,12 @@ class main:
             order_refresh_window_lower_boundary=self.order_refresh_window_lower_boundary,
             order_refresh_window_upper_boundary=self.order_refresh_window_upper_boundary,
             managed_rfqs=self.managed_rfqs,
-            managed_mmp=self.managed_mmp
+            managed_mmp=self.managed_mmp,
+            order_replace_tick_threshold=self.order_replace_tick_threshold,
+            order_requote_mode=self.order_requote_mode,
+            order_requote_mark_move_ticks=self.order_requote_mark_move_ticks,
+            order_requote_min_interval=self.order_requote_min_interval,
+            order_operation_concurrency=self.order_operation_concurrency
             )
 
         # Test Create RFQ
@@ -169,15 +218,21 @@ class main:
         #     self.test_create_rfq()
         #     )
 
-        while True:
-            await asyncio.sleep(600)
+        try:
+            while True:
+                await asyncio.sleep(600)
+                logging.info(f'REST Rate Limiter: {self.rest_client.rate_limiter.stats()}')
+                logging.info(f'WS Message Queue: {self.ws_msg_queue.stats()}')
+                logging.info(f'Order Operations: {self.order_manager.order_operation_stats()}')
+        finally:
+            # Release pooled RESToverHTTP connections
+            await self.rest_client.close()
 
     async def test_create_rfq(self) -> None:
         access_key = os.environ.get('TAKER_ACCESS_KEY')
         secret_key = os.environ.get('TAKER_SECRET_KEY')
 
-        while not self.ws_client.connection_authentication:
-            await asyncio.sleep(0)
+        await self.lifecycle.wait_for(LifecycleState.AUTHENTICATED)
         client: ParadigmRESTClient = ParadigmRESTClient(
             connection_url=self.http_url,
             access_key=access_key,
@@ -234,5 +289,11 @@ if __name__ == "__main__":
         order_price_worse_than_mark_flag=os.environ['ORDER_PRICE_WORSE_THAN_MARK_FLAG'],
         order_pricing_tick_multiple=os.environ['ORDER_PRICING_TICK_MULTIPLE'],
         order_refresh_window_lower_boundary=os.environ['ORDER_REFRESH_WINDOW_LOWER_BOUNDARY'],
-        order_refresh_window_upper_boundary=os.environ['ORDER_REFRESH_WINDOW_UPPER_BOUNDARY']
+        order_refresh_window_upper_boundary=os.environ['ORDER_REFRESH_WINDOW_UPPER_BOUNDARY'],
+        order_replace_tick_threshold=os.getenv('ORDER_REPLACE_TICK_THRESHOLD', '0'),
+        order_requote_mode=os.getenv('ORDER_REQUOTE_MODE', 'REFRESH_WINDOW'),
+        order_requote_mark_move_ticks=os.getenv('ORDER_REQUOTE_MARK_MOVE_TICKS', '1'),
+        order_requote_min_interval=os.getenv('ORDER_REQUOTE_MIN_INTERVAL', '0'),
+        order_operation_concurrency=os.getenv('ORDER_OPERATION_CONCURRENCY', '16'),
+        instrument_snapshot_path=os.getenv('INSTRUMENT_SNAPSHOT_PATH', '')
         )
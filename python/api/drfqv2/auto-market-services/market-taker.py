@@ -22,10 +22,13 @@ Environment Variables:
     ACCOUNT_NAME - Paradigm Venue API Key Name.
     ACCESS_KEY - Paradgim Access Key.
     SECRET_KEY - Paradigm Secret Key.
+    INSTRUMENT_SNAPSHOT_PATH - Path of the on-disk Instrument snapshot used to warm start. '' to disable.
+                               Mount a volume at its directory to keep it across container recreation.
 
 Requirements:
     pip3 install websockets
     pip3 install aiohttp
+    pip3 install orjson (optional, faster WebSocket message decoding)
 """
 
 # built ins
@@ -40,6 +43,9 @@ from helpers.managers import ManagedInstruments, TakerManagedRFQs
 from helpers.rfq_creator import RFQCreator
 from helpers.order_manager import TakerOrderManager
 from helpers.processors import ParadigmWSMessageProcessor
+from helpers.lifecycle import ServiceLifecycle
+from helpers.snapshots import InstrumentSnapshot
+from helpers.queues import PrioritizedMessageQueue
 from helpers.constants import RFQState
 
 
@@ -53,16 +59,18 @@ class main:
         http_url: str,
         account_name: str,
         access_key: str,
-        secret_key: str
+        secret_key: str,
+        instrument_snapshot_path: str
             ) -> None:
         self.ws_url: str = ws_url
         self.http_url: str = http_url
         self.account_name: str = account_name
         self.access_key: str = access_key
         self.secret_key: str = secret_key
+        self.instrument_snapshot_path: str = instrument_snapshot_path
 
         # Instance Variables
-        self.ws_msg_queue: asyncio.Queue = asyncio.Queue()
+        self.ws_msg_queue: PrioritizedMessageQueue = PrioritizedMessageQueue()
 
         # Instantiate Market Maker Coroutine
         asyncio.get_event_loop().run_until_complete(
@@ -74,6 +82,9 @@ class main:
         Primary coroutine to coordinate and manage dependencies
         to make markets.
         """
+        # Instantiate Service Lifecycle
+        self.lifecycle: ServiceLifecycle = ServiceLifecycle()
+
         # Instantiate RESToverHTTP Client
         self.rest_client: ParadigmRESTClient = ParadigmRESTClient(
             connection_url=self.http_url,
@@ -93,6 +104,7 @@ class main:
             connection_url=self.ws_url,
             access_key=self.access_key,
             exgest_queue=self.ws_msg_queue,
+            lifecycle=self.lifecycle,
             channels_to_subscribe_on_start=[
                 'rfqs',
                 'rfq_orders'
@@ -101,14 +113,19 @@ class main:
 
         # Instantiate Instrument Management Class
         self.managed_instruments: ManagedInstruments = ManagedInstruments(
-            rest_client=self.rest_client
+            rest_client=self.rest_client,
+            lifecycle=self.lifecycle,
+            snapshot=InstrumentSnapshot(
+                path=self.instrument_snapshot_path
+                ) if self.instrument_snapshot_path else None
             )
 
         # Instantiate RFQ Management Class
         self.managed_rfqs: TakerManagedRFQs = TakerManagedRFQs(
             rest_client=self.rest_client,
             ws_client=self.ws_client,
-            managed_instruments=self.managed_instruments
+            managed_instruments=self.managed_instruments,
+            lifecycle=self.lifecycle
             )
 
         # Instantiate RFQ Creator Class
@@ -131,8 +148,14 @@ class main:
             managed_rfqs=self.managed_rfqs
             )
 
-        while True:
-            await asyncio.sleep(600)
+        try:
+            while True:
+                await asyncio.sleep(600)
+                logging.info(f'REST Rate Limiter: {self.rest_client.rate_limiter.stats()}')
+                logging.info(f'WS Message Queue: {self.ws_msg_queue.stats()}')
+        finally:
+            # Release pooled RESToverHTTP connections
+            await self.rest_client.close()
 
 
 if __name__ == "__main__":
@@ -155,5 +178,6 @@ if __name__ == "__main__":
         http_url=http_url,
         account_name=os.environ['TAKER_ACCOUNT_NAME'],
         access_key=os.environ['TAKER_ACCESS_KEY'],
-        secret_key=os.environ['TAKER_SECRET_KEY']
+        secret_key=os.environ['TAKER_SECRET_KEY'],
+        instrument_snapshot_path=os.getenv('INSTRUMENT_SNAPSHOT_PATH', '')
         )
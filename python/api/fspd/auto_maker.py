@@ -51,8 +51,9 @@ import math
 import os
 import signal
 import time
+from collections import deque
 from random import randint, shuffle
-from typing import Dict, List, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
 import aiohttp
 import websockets
@@ -61,18 +62,111 @@ import websockets
 managed_strategies = {}
 strategy_order_payloads = {}
 
+
+class RateLimiter:
+    """
+    Event-driven token bucket.
+
+    Tokens refill continuously up to the bucket capacity. Coroutines
+    waiting for a token queue FIFO within their lane and are woken by
+    a single timer, with lanes served round-robin so new orders and
+    replaces share the budget fairly.
+    """
+
+    def __init__(self, rate: float, capacity: float, lanes: Tuple[str, ...]) -> None:
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.tokens: float = capacity
+        self.updated_at: float = time.monotonic()
+        self.lanes: Deque[str] = deque(lanes)
+        self.waiters: Dict[str, Deque[asyncio.Future]] = {lane: deque() for lane in lanes}
+        self.wake_up_handle: Optional[asyncio.TimerHandle] = None
+
+    def _refill(self) -> None:
+        now: float = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def _waiting(self) -> int:
+        return sum(len(waiters) for waiters in self.waiters.values())
+
+    def _schedule_wake_up(self) -> None:
+        if self.wake_up_handle is not None or not self._waiting():
+            return
+        delay: float = max(0.0, (1 - self.tokens) / self.rate)
+        self.wake_up_handle = asyncio.get_event_loop().call_later(delay, self._wake_up)
+
+    def _wake_up(self) -> None:
+        self.wake_up_handle = None
+        self._refill()
+
+        while self.tokens >= 1 and self._waiting():
+            lane: str = self.lanes[0]
+            self.lanes.rotate(-1)
+            waiters: Deque[asyncio.Future] = self.waiters[lane]
+            while waiters:
+                waiter: asyncio.Future = waiters.popleft()
+                if not waiter.done():
+                    self.tokens -= 1
+                    waiter.set_result(None)
+                    break
+
+        self._schedule_wake_up()
+
+    async def acquire(self, lane: str) -> None:
+        """
+        Waits until a token is available in the bucket.
+        """
+        self._refill()
+        if self.tokens >= 1 and not self._waiting():
+            self.tokens -= 1
+            return
+
+        waiter: asyncio.Future = asyncio.get_event_loop().create_future()
+        self.waiters[lane].append(waiter)
+        self._schedule_wake_up()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.tokens += 1
+            elif waiter in self.waiters[lane]:
+                self.waiters[lane].remove(waiter)
+            raise
+
+
 # transmission control
-rate_limit_dict = {}
+# Paradigm's default rate limit is 200 requests per second per account.
+rate_limiter = RateLimiter(rate=200, capacity=200, lanes=('default', 'submit', 'replace'))
+# Shared ClientSession, requests reuse its keep-alive connections
+http_session: Optional[aiohttp.ClientSession] = None
+# Held so the SIGTERM shutdown task is not garbage collected
+shutdown_task: Optional[asyncio.Task] = None
 
 
 def shutdown():
-    asyncio.get_event_loop().run_until_complete(cancel_all_orders())
+    # Called by the running loop's signal handler, so schedule
+    # the shutdown rather than blocking on the loop
+    global shutdown_task
+    if shutdown_task is None:
+        shutdown_task = asyncio.get_event_loop().create_task(_shutdown())
+
+
+async def _shutdown() -> None:
+    """
+    Cancels all Orders, closes the shared ClientSession
+    and stops the event loop.
+    """
+    try:
+        await cancel_all_orders()
+    finally:
+        await close_http_session()
+        asyncio.get_event_loop().stop()
 
 
 async def main() -> None:
     loop = asyncio.get_event_loop()
     loop.add_signal_handler(signal.SIGTERM, shutdown)
-    loop.create_task(rate_limit_refiller())
     loop.create_task(manage_websocket_messages())
     loop.create_task(order_manager())
 
@@ -255,56 +349,6 @@ async def exgest_strategies(strategy_id: str) -> None:
                 strategy_order_payloads.pop(label)
 
 
-async def rate_limiter(venue: str, rate_limit_increment: int) -> int:
-    """
-    Function ensures rate limit is respected.
-
-    Paradigm's default rate limit is
-    200 requests per second per account.
-    """
-    global rate_limit_dict
-
-    run_flag: int = 0
-
-    if venue not in list(rate_limit_dict):
-        return run_flag
-
-    if 'remaining_amount' not in list(rate_limit_dict[venue]):
-        return run_flag
-
-    if rate_limit_dict[venue]['remaining_amount'] >= 1:
-        rate_limit_dict[venue]['remaining_amount'] -= rate_limit_increment
-        run_flag = 1
-    return run_flag
-
-
-async def rate_limit_refiller() -> None:
-    """
-    This coroutine refills the rate limit
-    buckets per the venue's Rate Limit convention.
-    """
-    global rate_limit_dict
-
-    venue_rate_limits: Dict = {'PDGM': 200}
-
-    remaining_refresh_boundary: float = time.time() + 1
-
-    for venue in list(venue_rate_limits):
-        if venue not in list(rate_limit_dict):
-            rate_limit_dict[venue] = {}
-        if 'remaining_amount' not in list(rate_limit_dict[venue]):
-            rate_limit_dict[venue]['remaining_amount'] = venue_rate_limits[venue]
-
-    while True:
-        while time.time() > remaining_refresh_boundary:
-            remaining_refresh_boundary = time.time() + 1
-
-            for venue in list(venue_rate_limits):
-                rate_limit_dict[venue]['remaining_amount'] = venue_rate_limits[venue]
-
-        await asyncio.sleep(1)
-
-
 def order_creator() -> Tuple[List[str], List[str]]:
     """
     Creates Order Payloads
@@ -408,20 +452,26 @@ async def order_manager_one_iteration():
         f'replacing {len(orders_to_replace)} orders. Based off of {len(strategy_order_payloads)=}.'
     )
 
-    loop = asyncio.get_event_loop()
-    for label in orders_to_submit:
-        loop.create_task(
-            post_orders(
-                payload=strategy_order_payloads[label],
-            )
-        )
+    # Pipeline the batch over the pooled connections and
+    # route each result back to its label
+    labels: List[str] = orders_to_submit + orders_to_replace
+    results: List = await asyncio.gather(
+        *[post_orders(payload=strategy_order_payloads[label]) for label in orders_to_submit],
+        *[
+            post_orders_orderid_replace(payload=strategy_order_payloads[label])
+            for label in orders_to_replace
+        ],
+        return_exceptions=True,
+    )
 
-    for label in orders_to_replace:
-        loop.create_task(
-            post_orders_orderid_replace(
-                payload=strategy_order_payloads[label],
-            )
-        )
+    failed_labels: List[str] = []
+    for label, result in zip(labels, results):
+        if isinstance(result, Exception):
+            logging.error(f'Order operation failed | Label: {label} | {result!r}')
+        if result is not True:
+            failed_labels.append(label)
+    if failed_labels:
+        logging.info(f'{len(failed_labels)} of {len(labels)} Order operations not accepted.')
 
 
 async def order_manager() -> None:
@@ -440,15 +490,42 @@ def round_nearest(x, a):
     return round(round(x / a) * a, -int(math.floor(math.log10(a))))
 
 
-def rate_limit_decorator(f):
-    async def wrapper(*args, **kwargs):
-        run_flag: int = 0
-        while run_flag == 0:
-            run_flag = await rate_limiter(venue='PDGM', rate_limit_increment=1)
-            await asyncio.sleep(0)
-        return await f(*args, **kwargs)
+async def get_http_session() -> aiohttp.ClientSession:
+    """
+    Returns the shared ClientSession, creating it on first use.
+    """
+    global http_session
+    if http_session is None or http_session.closed:
+        http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=30)
+        )
+    return http_session
+
+
+async def close_http_session() -> None:
+    """
+    Closes the shared ClientSession if one was opened.
+    """
+    global http_session
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+    http_session = None
+
+
+def rate_limit_decorator(lane: str = 'default'):
+    """
+    Waits for a rate limit token in the given lane
+    before calling the decorated coroutine.
+    """
+
+    def decorator(f):
+        async def wrapper(*args, **kwargs):
+            await rate_limiter.acquire(lane=lane)
+            return await f(*args, **kwargs)
+
+        return wrapper
 
-    return wrapper
+    return decorator
 
 
 # RESToverHTTP Interface
@@ -494,7 +571,7 @@ def create_rest_headers(
     }
 
 
-@rate_limit_decorator
+@rate_limit_decorator()
 async def get_strategies(strategy_id: str = None) -> Dict:
     """
     Paradigm RESToverHTTP endpoint.
@@ -515,23 +592,23 @@ async def get_strategies(strategy_id: str = None) -> Dict:
         body=payload,
     )
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(paradigm_http_url + path, headers=headers) as raw_response:
-            raw_response: aiohttp.ClientResponse
-            status_code: int = raw_response.status
-            response: Dict = await raw_response.json()
-            if status_code != 200:
-                message: str = 'Unable to [GET] /strategies'
-                if strategy_id is not None:
-                    message += f'?id={strategy_id}'
-                logging.error(message)
-                logging.error(f'Status Code: {status_code}')
-                logging.error(f'Response Text: {response}')
-            response = response['results']
+    session: aiohttp.ClientSession = await get_http_session()
+    async with session.get(paradigm_http_url + path, headers=headers) as raw_response:
+        raw_response: aiohttp.ClientResponse
+        status_code: int = raw_response.status
+        response: Dict = await raw_response.json()
+        if status_code != 200:
+            message: str = 'Unable to [GET] /strategies'
+            if strategy_id is not None:
+                message += f'?id={strategy_id}'
+            logging.error(message)
+            logging.error(f'Status Code: {status_code}')
+            logging.error(f'Response Text: {response}')
+        response = response['results']
     return response
 
 
-@rate_limit_decorator
+@rate_limit_decorator()
 async def cancel_all_orders() -> None:
     """
     Paradigm RESToverHTTP endpoint.
@@ -549,17 +626,17 @@ async def cancel_all_orders() -> None:
         body=payload,
     )
 
-    async with aiohttp.ClientSession() as session:
-        async with session.delete(paradigm_http_url + path, headers=headers) as response:
-            status_code: int = response.status
-            if status_code != 204:
-                logging.error('Unable to [DELETE] /orders')
-                logging.error(f'Status Code: {status_code}')
-            else:
-                logging.info('Successsfully canceled all Orders.')
+    session: aiohttp.ClientSession = await get_http_session()
+    async with session.delete(paradigm_http_url + path, headers=headers) as response:
+        status_code: int = response.status
+        if status_code != 204:
+            logging.error('Unable to [DELETE] /orders')
+            logging.error(f'Status Code: {status_code}')
+        else:
+            logging.info('Successsfully canceled all Orders.')
 
 
-@rate_limit_decorator
+@rate_limit_decorator(lane='submit')
 async def post_orders(payload: Dict) -> bool:
     """
     Paradigm RESToverHTTP endpoint.
@@ -580,28 +657,28 @@ async def post_orders(payload: Dict) -> bool:
         body=payload_body,
     )
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(
-                paradigm_http_url + path, headers=headers, json=_payload
-            ) as raw_response:
-                raw_response: aiohttp.ClientResponse
-                status_code: int = raw_response.status
-                response: Dict = await raw_response.json(content_type=None)
-                if status_code == 201:
-                    order_id = response['id']
-                    payload['order_id'] = order_id
-                    return True
-                else:
-                    return False
+    session: aiohttp.ClientSession = await get_http_session()
+    try:
+        async with session.post(
+            paradigm_http_url + path, headers=headers, json=_payload
+        ) as raw_response:
+            raw_response: aiohttp.ClientResponse
+            status_code: int = raw_response.status
+            response: Dict = await raw_response.json(content_type=None)
+            if status_code == 201:
+                order_id = response['id']
+                payload['order_id'] = order_id
+                return True
+            else:
+                return False
 
-        except aiohttp.ClientConnectorError as e:
-            logging.error(f'[POST] /orders ClientConnectorError: {e}')
-            return False
+    except aiohttp.ClientConnectorError as e:
+        logging.error(f'[POST] /orders ClientConnectorError: {e}')
+        return False
 
 
-@rate_limit_decorator
-async def post_orders_orderid_replace(payload: Dict) -> None:
+@rate_limit_decorator(lane='replace')
+async def post_orders_orderid_replace(payload: Dict) -> bool:
     """
     Paradigm RESToverHTTP endpoint.
     [POST] /orders/{order_id}/replace
@@ -633,24 +710,27 @@ async def post_orders_orderid_replace(payload: Dict) -> None:
     )
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                paradigm_http_url + path, headers=headers, json=_payload
-            ) as raw_response:
-                raw_response: aiohttp.ClientResponse
-                status_code: int = raw_response.status
-                response: Dict = await raw_response.json(content_type=None)
-                if status_code == 201:
-                    order_id = response['id']
-                    payload['order_id'] = order_id
-                elif status_code == 403 and response and response.get('code') == 4003:
-                    # a Taker may have taken the order.
-                    pass
-                else:
-                    logging.error('POST not accepted.')
+        session: aiohttp.ClientSession = await get_http_session()
+        async with session.post(
+            paradigm_http_url + path, headers=headers, json=_payload
+        ) as raw_response:
+            raw_response: aiohttp.ClientResponse
+            status_code: int = raw_response.status
+            response: Dict = await raw_response.json(content_type=None)
+            if status_code == 201:
+                order_id = response['id']
+                payload['order_id'] = order_id
+                return True
+            elif status_code == 403 and response and response.get('code') == 4003:
+                # a Taker may have taken the order.
+                return False
+            else:
+                logging.error('POST not accepted.')
+                return False
 
     except aiohttp.ClientConnectorError as e:
         logging.error(f'[POST] /orders ClientConnectorError: {e}')
+        return False
     finally:
         strategy_order_payloads[label]['replacing_order'] = False
 